@@ -1,6 +1,7 @@
 import threading
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from .config import load_config
 from .routes import create_router
@@ -11,7 +12,7 @@ CONFIG = load_config()
 STATE = AgentState()
 STOP_EVENT = threading.Event()
 
-app = FastAPI(title="KVM Host Agent API", version="0.5.0")
+app = FastAPI(title="KVM Host Agent API", version="0.5.0", default_response_class=ORJSONResponse)
 app.include_router(create_router(CONFIG, STATE))
 
 
@@ -3,11 +3,18 @@ import threading
 from datetime import datetime, timezone
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .config import AgentConfig
 from .state import AgentState
 
 
+# One pooled session so register/heartbeat posts reuse the dashboard connection.
+DASHBOARD_SESSION = requests.Session()
+DASHBOARD_SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+DASHBOARD_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+
 def detect_cpu_memory() -> tuple[int, int]:
     cpu_cores = os.cpu_count() or 0
     memory_mb = 0
@@ -23,6 +30,11 @@ def detect_cpu_memory() -> tuple[int, int]:
     return cpu_cores, memory_mb
 
 
+def _check_response(response: requests.Response) -> None:
+    if response.status_code >= 400:
+        raise requests.HTTPError(f"dashboard returned {response.status_code} for {response.url}", response=response)
+
+
 def register(config: AgentConfig, cpu_cores: int, memory_mb: int) -> None:
     payload = {
         "host_id": config.host_id,
@@ -33,8 +45,8 @@ def register(config: AgentConfig, cpu_cores: int, memory_mb: int) -> None:
         "libvirt_uri": config.libvirt_uri,
     }
     url = f"{config.dashboard_url}/api/v1/hosts/register"
-    response = requests.post(url, json=payload, timeout=10)
-    response.raise_for_status()
+    response = DASHBOARD_SESSION.post(url, json=payload, timeout=10)
+    _check_response(response)
 
 
 def send_heartbeat(config: AgentConfig, cpu_cores: int, memory_mb: int) -> None:
@@ -44,8 +56,8 @@ def send_heartbeat(config: AgentConfig, cpu_cores: int, memory_mb: int) -> None:
         "memory_mb": memory_mb,
     }
     url = f"{config.dashboard_url}/api/v1/hosts/{config.host_id}/heartbeat"
-    response = requests.post(url, json=payload, timeout=10)
-    response.raise_for_status()
+    response = DASHBOARD_SESSION.post(url, json=payload, timeout=10)
+    _check_response(response)
 
 
 def push_to_dashboard(config: AgentConfig, state: AgentState) -> None:
@@ -64,9 +64,7 @@ def require_ui_auth(request: Request, db: Session = Depends(get_db)) -> Dashboar
     return user
 
 
-def render_login_page(error: str = "") -> str:
-    err = f"<div style='color:#ff9cbc;margin-bottom:8px'>{error}</div>" if error else ""
-    return f"""
+_LOGIN_PAGE_TMPL = """
 <!doctype html>
 <html>
   <head>
@@ -74,17 +72,17 @@ def render_login_page(error: str = "") -> str:
     <meta name='viewport' content='width=device-width, initial-scale=1' />
     <title>KVM Dashboard Login</title>
     <style>
-      body {{ background:#1f2633; color:#ecf1fa; font-family:Inter,system-ui,sans-serif; margin:0; display:grid; place-items:center; min-height:100vh; }}
-      .card {{ width:min(430px,92vw); background:#263145; border:1px solid #3a4a62; border-radius:10px; padding:18px; }}
-      input {{ width:100%; box-sizing:border-box; margin:6px 0 10px; background:#0f1a3b; border:1px solid #2a447f; color:#dce7ff; border-radius:8px; padding:9px; }}
-      button {{ width:100%; border:1px solid #2f5dad; background:#123777; color:#e8f2ff; padding:10px; border-radius:8px; cursor:pointer; }}
-      .muted {{ color:#a9b6cc; font-size:12px; margin-top:8px; }}
+      body { background:#1f2633; color:#ecf1fa; font-family:Inter,system-ui,sans-serif; margin:0; display:grid; place-items:center; min-height:100vh; }
+      .card { width:min(430px,92vw); background:#263145; border:1px solid #3a4a62; border-radius:10px; padding:18px; }
+      input { width:100%%; box-sizing:border-box; margin:6px 0 10px; background:#0f1a3b; border:1px solid #2a447f; color:#dce7ff; border-radius:8px; padding:9px; }
+      button { width:100%%; border:1px solid #2f5dad; background:#123777; color:#e8f2ff; padding:10px; border-radius:8px; cursor:pointer; }
+      .muted { color:#a9b6cc; font-size:12px; margin-top:8px; }
     </style>
   </head>
   <body>
     <form class='card' method='post' action='/login'>
       <h2 style='margin-top:0'>KVM Dashboard Login</h2>
-      {err}
+      %s
       <label>Username</label>
       <input name='username' placeholder='admin' required />
       <label>Password</label>
@@ -95,11 +93,18 @@ def render_login_page(error: str = "") -> str:
   </body>
 </html>
 """
+# The error-free login page never changes, so encode it once.
+_LOGIN_PAGE_BYTES = (_LOGIN_PAGE_TMPL % "").encode("utf-8")
+
+
+def render_login_page(error: str = "") -> str:
+    err = f"<div style='color:#ff9cbc;margin-bottom:8px'>{error}</div>" if error else ""
+    return _LOGIN_PAGE_TMPL % err
 
 
 def login_get(db: Session = Depends(get_db)) -> HTMLResponse:
     ensure_default_admin(db)
-    return HTMLResponse(render_login_page())
+    return HTMLResponse(_LOGIN_PAGE_BYTES)
 
 
 def login_post(username: str = Form(...), password: str = Form(...), db: Session = Depends(get_db)) -> RedirectResponse | HTMLResponse:
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from urllib.parse import urlencode, urlparse
 from uuid import uuid4
 
 
+# Each request mints a new ticket, so only the display URI parsing is worth caching.
+@lru_cache(maxsize=1024)
 def _display_host_port(display_uri: str) -> tuple[str | None, int | None]:
     try:
         parsed = urlparse(display_uri)
@@ -1,8 +1,9 @@
 import os
 import threading
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from .models import Base
@@ -15,8 +16,21 @@ ALLOW_SQLITE_FOR_TESTS = os.getenv("ALLOW_SQLITE_FOR_TESTS", "false").strip().lo
 if not DATABASE_URL.startswith("postgresql") and not (ALLOW_SQLITE_FOR_TESTS and DATABASE_URL.startswith("sqlite")):
     raise RuntimeError("DATABASE_URL must be a PostgreSQL URL (postgresql+psycopg://...) for this build")
 
+
+def _pool_options(url: str, *, env_prefix: str = "DB_", pool_size: int = 20, max_overflow: int = 20) -> dict[str, int | bool]:
+    """Connection pool settings; SQLite test databases keep SQLAlchemy's defaults."""
+    options: dict[str, int | bool] = {"pool_pre_ping": True}
+    if url.startswith("postgresql"):
+        options.update(
+            pool_size=int(os.getenv(f"{env_prefix}POOL_SIZE", str(pool_size))),
+            max_overflow=int(os.getenv(f"{env_prefix}MAX_OVERFLOW", str(max_overflow))),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE_S", "3600")),
+        )
+    return options
+
+
 try:
-    engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+    engine = create_engine(DATABASE_URL, **_pool_options(DATABASE_URL))
 except ModuleNotFoundError as exc:
     raise RuntimeError("PostgreSQL driver missing. Install dashboard dependencies (psycopg[binary]).") from exc
 
@@ -45,3 +59,45 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def _async_database_url(url: str) -> str:
+    """Map DATABASE_URL onto a driver with asyncio support (psycopg 3 handles both modes)."""
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    if url.startswith("postgresql://"):
+        return "postgresql+psycopg://" + url[len("postgresql://"):]
+    return url
+
+
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def _get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    # Built on first use so sync-only processes never need the async driver.
+    global _async_engine, _async_session_factory
+    if _async_session_factory is None:
+        with _init_lock:
+            if _async_session_factory is None:
+                try:
+                    _async_engine = create_async_engine(
+                        _async_database_url(DATABASE_URL),
+                        # The async engine only serves a handful of read endpoints, so it gets a small pool.
+                        **_pool_options(DATABASE_URL, env_prefix="DB_ASYNC_", pool_size=5, max_overflow=5),
+                    )
+                except ModuleNotFoundError as exc:
+                    raise RuntimeError("Async database driver missing. Install dashboard dependencies (psycopg[binary], aiosqlite for SQLite tests).") from exc
+                _async_session_factory = async_sessionmaker(_async_engine, expire_on_commit=False)
+    return _async_session_factory
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    init_db()
+    async with _get_async_session_factory()() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    if _async_engine is not None:
+        await _async_engine.dispose()
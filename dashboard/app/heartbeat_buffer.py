@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Callable
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+
+from .models import Host
+
+
+logger = logging.getLogger(__name__)
+
+
+_HEARTBEAT_UPDATE = (
+    update(Host.__table__)
+    .where(Host.__table__.c.host_id == bindparam("b_host_id"))
+    .values(
+        status=bindparam("b_status"),
+        cpu_cores=bindparam("b_cpu_cores"),
+        memory_mb=bindparam("b_memory_mb"),
+        last_heartbeat=bindparam("b_last_heartbeat"),
+    )
+)
+
+
+class HeartbeatBuffer:
+    """Coalesce host heartbeats in memory and write them in one transaction per flush."""
+
+    def __init__(self, session_factory: Callable[[], Session], *, flush_interval_s: float, max_batch: int = 256) -> None:
+        self.flush_interval_s = flush_interval_s
+        self.max_batch = max_batch
+        self._session_factory = session_factory
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        # Held while a batch is being written so pop() never races a flush.
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def put(self, host_id: str, *, status: str, cpu_cores: int, memory_mb: int, last_heartbeat: datetime) -> None:
+        self._ensure_started()
+        with self._lock:
+            self._pending[host_id] = {
+                "status": status,
+                "cpu_cores": cpu_cores,
+                "memory_mb": memory_mb,
+                "last_heartbeat": last_heartbeat,
+            }
+            if len(self._pending) >= self.max_batch:
+                self._wake.set()
+
+    def pop(self, host_id: str) -> dict[str, Any] | None:
+        """Take a host's unflushed heartbeat so a direct write can apply it instead."""
+        with self._flush_lock, self._lock:
+            return self._pending.pop(host_id, None)
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+
+            rows = [
+                {
+                    "b_host_id": host_id,
+                    "b_status": values["status"],
+                    "b_cpu_cores": values["cpu_cores"],
+                    "b_memory_mb": values["memory_mb"],
+                    "b_last_heartbeat": values["last_heartbeat"],
+                }
+                for host_id, values in batch.items()
+            ]
+            db = self._session_factory()
+            try:
+                db.execute(_HEARTBEAT_UPDATE, rows)
+                db.commit()
+            except Exception:
+                db.rollback()
+                with self._lock:
+                    for host_id, values in batch.items():
+                        self._pending.setdefault(host_id, values)
+                raise
+            finally:
+                db.close()
+            return len(rows)
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self.flush()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="heartbeat-flusher", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval_s)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("heartbeat flush failed")
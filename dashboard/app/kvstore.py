@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import os
+from abc import ABC, abstractmethod
+from collections import deque
+from itertools import islice
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class KVStore(ABC):
+    """Shared record collections: capped newest-first lists and insertion-ordered hashes."""
+
+    @abstractmethod
+    def list_push(self, key: str, record: BaseModel, maxlen: int) -> None:
+        ...
+
+    @abstractmethod
+    def list_range(self, key: str, limit: int | None = None) -> list[Any]:
+        """Return up to ``limit`` records, newest first."""
+
+    @abstractmethod
+    def list_len(self, key: str) -> int:
+        ...
+
+    @abstractmethod
+    def hash_set(self, key: str, field: str, record: BaseModel) -> None:
+        ...
+
+    @abstractmethod
+    def hash_get(self, key: str, field: str) -> Any | None:
+        ...
+
+    @abstractmethod
+    def hash_newest(self, key: str, limit: int | None = None) -> list[Any]:
+        """Return up to ``limit`` records in reverse insertion order."""
+
+    @abstractmethod
+    def hash_len(self, key: str) -> int:
+        ...
+
+
+class InMemoryBackend(KVStore):
+    """Process-local store holding the record objects themselves; the single-worker default."""
+
+    def __init__(self) -> None:
+        self._lists: dict[str, deque[Any]] = {}
+        self._hashes: dict[str, dict[str, Any]] = {}
+
+    def list_push(self, key: str, record: BaseModel, maxlen: int) -> None:
+        items = self._lists.get(key)
+        if items is None:
+            items = self._lists.setdefault(key, deque(maxlen=maxlen))
+        items.appendleft(record)
+
+    def list_range(self, key: str, limit: int | None = None) -> list[Any]:
+        # deque.copy() is atomic, unlike iterating a deque other threads append to.
+        items = self._lists.get(key, deque()).copy()
+        return list(items) if limit is None else list(islice(items, limit))
+
+    def list_len(self, key: str) -> int:
+        return len(self._lists.get(key, ()))
+
+    def hash_set(self, key: str, field: str, record: BaseModel) -> None:
+        self._hashes.setdefault(key, {})[field] = record
+
+    def hash_get(self, key: str, field: str) -> Any | None:
+        return self._hashes.get(key, {}).get(field)
+
+    def hash_newest(self, key: str, limit: int | None = None) -> list[Any]:
+        values = reversed(self._hashes.get(key, {}).values())
+        return list(values) if limit is None else list(islice(values, limit))
+
+    def hash_len(self, key: str) -> int:
+        return len(self._hashes.get(key, ()))
+
+
+class RedisBackend(KVStore):
+    """Redis-backed store shared by every worker and replica.
+
+    Records are stored as JSON and decoded with the model registered for their key,
+    or for the part before the first ``:`` when the key itself is not registered.
+    Hash insertion order is kept in a companion ``<key>:order`` list.
+    """
+
+    def __init__(self, url: str, models: dict[str, type[BaseModel]], *, prefix: str = "kvm-dashboard:") -> None:
+        try:
+            import redis
+        except ModuleNotFoundError as exc:
+            raise RuntimeError("KV_BACKEND=redis requires the redis package (pip install redis).") from exc
+        self._client = redis.Redis.from_url(url)
+        self._models = models
+        self._prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}{key}"
+
+    def _decode(self, key: str, raw: bytes | None) -> Any | None:
+        if raw is None:
+            return None
+        model = self._models.get(key) or self._models[key.split(":", 1)[0]]
+        return model.model_validate_json(raw)
+
+    def list_push(self, key: str, record: BaseModel, maxlen: int) -> None:
+        name = self._key(key)
+        pipe = self._client.pipeline()
+        pipe.lpush(name, record.model_dump_json())
+        pipe.ltrim(name, 0, maxlen - 1)
+        pipe.execute()
+
+    def list_range(self, key: str, limit: int | None = None) -> list[Any]:
+        stop = -1 if limit is None else limit - 1
+        return [self._decode(key, raw) for raw in self._client.lrange(self._key(key), 0, stop)]
+
+    def list_len(self, key: str) -> int:
+        return int(self._client.llen(self._key(key)))
+
+    def hash_set(self, key: str, field: str, record: BaseModel) -> None:
+        name = self._key(key)
+        # hset reports 0 when the field already existed; overwrites keep their original position.
+        if self._client.hset(name, field, record.model_dump_json()):
+            self._client.lpush(f"{name}:order", field)
+
+    def hash_get(self, key: str, field: str) -> Any | None:
+        return self._decode(key, self._client.hget(self._key(key), field))
+
+    def hash_newest(self, key: str, limit: int | None = None) -> list[Any]:
+        name = self._key(key)
+        stop = -1 if limit is None else limit - 1
+        fields = self._client.lrange(f"{name}:order", 0, stop)
+        if not fields:
+            return []
+        return [self._decode(key, raw) for raw in self._client.hmget(name, fields) if raw is not None]
+
+    def hash_len(self, key: str) -> int:
+        return int(self._client.hlen(self._key(key)))
+
+
+def build_kv_store(models: dict[str, type[BaseModel]]) -> KVStore:
+    """Pick the backend from KV_BACKEND (``memory`` by default, or ``redis`` with REDIS_URL)."""
+    backend = os.getenv("KV_BACKEND", "memory").strip().lower()
+    if backend == "memory":
+        return InMemoryBackend()
+    if backend == "redis":
+        return RedisBackend(os.getenv("REDIS_URL", "redis://localhost:6379/0"), models)
+    raise RuntimeError(f"unsupported KV_BACKEND: {backend}")
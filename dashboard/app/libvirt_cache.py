@@ -1,24 +1,37 @@
 from __future__ import annotations
 
-import json
 import os
 import threading
 import time
 from typing import Any, Callable
 
+import orjson
 from fastapi import HTTPException
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.orm import Session
 
 from .models import Host
 
 
+class _RefreshFlight:
+    """One in-progress refresh of a host that concurrent callers wait on instead of repeating."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: dict[str, Any] | None = None
+        self.error: BaseException | None = None
+
+
 class LibvirtCacheStore:
     def __init__(self, ttl_s: int) -> None:
         self.ttl_s = ttl_s
         self.refresh_on_stale = os.getenv("LIBVIRT_REFRESH_ON_STALE", "false").strip().lower() in {"1","true","yes","on"}
         self._schema_checked = False
         self._schema_lock = threading.Lock()
+        self._inflight: dict[str, _RefreshFlight] = {}
+        self._inflight_lock = threading.Lock()
 
     def ensure_table(self, db: Session) -> None:
         if self._schema_checked:
@@ -49,6 +62,30 @@ class LibvirtCacheStore:
             self._schema_checked = True
 
     def refresh(self, db: Session, host: Host, fetcher: Callable[[Host, str], Any]) -> dict[str, Any]:
+        """Query libvirt and store the result; callers arriving mid-refresh share its outcome."""
+        with self._inflight_lock:
+            flight = self._inflight.get(host.host_id)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[host.host_id] = _RefreshFlight()
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return dict(flight.result)
+
+        try:
+            flight.result = self._refresh(db, host, fetcher)
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(host.host_id, None)
+            flight.done.set()
+        return dict(flight.result)
+
+    def _refresh(self, db: Session, host: Host, fetcher: Callable[[Host, str], Any]) -> dict[str, Any]:
         vms = fetcher(host, "list_vms")
         networks = fetcher(host, "list_networks")
         images = fetcher(host, "list_images")
@@ -70,19 +107,25 @@ class LibvirtCacheStore:
             """),
             {
                 "host_id": host.host_id,
-                "vms_json": json.dumps(vms),
-                "networks_json": json.dumps(networks),
-                "images_json": json.dumps(images),
-                "pools_json": json.dumps(pools),
+                "vms_json": orjson.dumps(vms).decode(),
+                "networks_json": orjson.dumps(networks).decode(),
+                "images_json": orjson.dumps(images).decode(),
+                "pools_json": orjson.dumps(pools).decode(),
                 "updated_at": now,
             },
         )
         db.commit()
         return {"vms": vms, "networks": networks, "images": images, "pools": pools, "updated_at": now, "cache": "miss"}
 
-    def invalidate(self, db: Session, host_id: str) -> None:
+    def invalidate(self, db: Session, *host_ids: str) -> None:
+        """Mark the cached rows of one or more hosts stale in a single statement and commit."""
+        if not host_ids:
+            return
         self.ensure_table(db)
-        db.execute(text("UPDATE host_libvirt_cache SET updated_at=0 WHERE host_id=:host_id"), {"host_id": host_id})
+        db.execute(
+            text("UPDATE host_libvirt_cache SET updated_at=0 WHERE host_id IN :host_ids").bindparams(bindparam("host_ids", expanding=True)),
+            {"host_ids": list(host_ids)},
+        )
         db.commit()
 
     def get(self, db: Session, host: Host, fetcher: Callable[[Host, str], Any], *, force_refresh: bool = False) -> dict[str, Any]:
@@ -96,10 +139,10 @@ class LibvirtCacheStore:
             age_s = time.time() - float(row.updated_at)
             if age_s <= self.ttl_s:
                 return {
-                    "vms": json.loads(row.vms_json),
-                    "networks": json.loads(row.networks_json),
-                    "images": json.loads(row.images_json),
-                    "pools": json.loads(row.pools_json),
+                    "vms": orjson.loads(row.vms_json),
+                    "networks": orjson.loads(row.networks_json),
+                    "images": orjson.loads(row.images_json),
+                    "pools": orjson.loads(row.pools_json),
                     "updated_at": float(row.updated_at),
                     "last_error": row.last_error,
                     "last_success_at": float(row.last_success_at) if row.last_success_at else None,
@@ -107,10 +150,10 @@ class LibvirtCacheStore:
                 }
             if not self.refresh_on_stale:
                 return {
-                    "vms": json.loads(row.vms_json),
-                    "networks": json.loads(row.networks_json),
-                    "images": json.loads(row.images_json),
-                    "pools": json.loads(row.pools_json),
+                    "vms": orjson.loads(row.vms_json),
+                    "networks": orjson.loads(row.networks_json),
+                    "images": orjson.loads(row.images_json),
+                    "pools": orjson.loads(row.pools_json),
                     "updated_at": float(row.updated_at),
                     "last_error": row.last_error,
                     "last_success_at": float(row.last_success_at) if row.last_success_at else None,
@@ -139,10 +182,10 @@ class LibvirtCacheStore:
                 )
                 db.commit()
                 return {
-                    "vms": json.loads(row.vms_json),
-                    "networks": json.loads(row.networks_json),
-                    "images": json.loads(row.images_json),
-                    "pools": json.loads(row.pools_json),
+                    "vms": orjson.loads(row.vms_json),
+                    "networks": orjson.loads(row.networks_json),
+                    "images": orjson.loads(row.images_json),
+                    "pools": orjson.loads(row.pools_json),
                     "updated_at": float(row.updated_at),
                     "last_error": str(exc.detail),
                     "last_success_at": float(row.last_success_at) if row.last_success_at else None,
@@ -74,6 +74,7 @@ class LibvirtRemote:
     def list_vms(self) -> list[dict[str, Any]]:
         names = [n.strip() for n in self._run(["list", "--all", "--name"]).splitlines() if n.strip()]
         rows: list[dict[str, Any]] = []
+        now = datetime.now(timezone.utc).isoformat()
         for name in names:
             info = self._run(["dominfo", name])
             cpu = int(re.search(r"CPU\(s\):\s+(\d+)", info).group(1)) if re.search(r"CPU\(s\):\s+(\d+)", info) else 0
@@ -99,7 +100,7 @@ class LibvirtRemote:
                 "networks": nets,
                 "labels": {"executor": "libvirt-direct"},
                 "annotations": {"libvirt_uri": self.uri},
-                "created_at": datetime.now(timezone.utc).isoformat(),
+                "created_at": now,
             })
         return rows
 
@@ -262,7 +263,8 @@ class LibvirtRemote:
 
     def snapshot_list(self, vm_id: str) -> list[dict[str, Any]]:
         out = self._run(["snapshot-list", vm_id, "--name"])
-        return [{"snapshot_id": s.strip(), "vm_id": vm_id, "name": s.strip(), "created_at": datetime.now(timezone.utc).isoformat()} for s in out.splitlines() if s.strip()]
+        now = datetime.now(timezone.utc).isoformat()
+        return [{"snapshot_id": s.strip(), "vm_id": vm_id, "name": s.strip(), "created_at": now} for s in out.splitlines() if s.strip()]
 
     def snapshot_revert(self, vm_id: str, snapshot_id: str) -> None:
         self._run(["snapshot-revert", vm_id, snapshot_id, "--running"])
@@ -371,12 +373,13 @@ class LibvirtRemote:
 
     def list_images(self) -> list[dict[str, Any]]:
         images: list[dict[str, Any]] = []
+        now = datetime.now(timezone.utc).isoformat()
         for pool in self.list_storage_pools():
             for vol in pool.get("volumes", []):
                 if vol["name"].endswith((".qcow2", ".iso", ".img")):
                     used_by = vol.get("used_by", "-")
                     in_use = bool(used_by and used_by != "-")
-                    images.append({"image_id": f"{pool['name']}::{vol['name']}", "name": vol["name"], "source_url": pool["name"], "status": "in-use" if in_use else "available", "used_by": used_by, "created_at": datetime.now(timezone.utc).isoformat(), "tags": ["in-use"] if in_use else []})
+                    images.append({"image_id": f"{pool['name']}::{vol['name']}", "name": vol["name"], "source_url": pool["name"], "status": "in-use" if in_use else "available", "used_by": used_by, "created_at": now, "tags": ["in-use"] if in_use else []})
         return images
 
 
@@ -1,15 +1,31 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+import html
+from itertools import islice, takewhile
 import os
-from typing import Any
+import re
+import secrets
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator
 from uuid import uuid4
-from urllib.parse import urlencode
-
-from fastapi import Depends, FastAPI, Form, HTTPException, Query, Request
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
-from sqlalchemy.orm import Session
-
-from .db import get_db, init_db
-from .models import Host
+from urllib.parse import quote_plus, urlencode
+import zlib
+
+import orjson
+from fastapi import BackgroundTasks, Depends, FastAPI, Form, HTTPException, Query, Request, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse, StreamingResponse
+from sqlalchemy import case, false, func, inspect, literal_column, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only
+
+from .db import SessionLocal, dispose_async_engine, get_async_db, get_db, init_db
+from .models import DashboardSession, Host
 from .schemas import (
     HeartbeatRequest,
     HostAction,
@@ -28,6 +44,8 @@ from .schemas import (
     NetworkAttachRequest,
     NetworkDetachRequest,
     NetworkCreateRequest,
+    ImageBatchDeleteItem,
+    ImageBatchDeleteRequest,
     ImageCreateRequest,
     ProjectCreateRequest,
     ProjectQuotaRequest,
@@ -44,18 +62,31 @@ from .schemas import (
 )
 from .schemas_day2 import VMOperationTaskRequest, VMRecoveryISOReleaseRequest, VMRecoveryISORequest
 from .day2_services import SUPPORTED_VM_TASK_TYPES, normalize_task_type
-from .ui_pages import render_dashboard_page
+from .ui_pages import DASHBOARD_CSS, DASHBOARD_CSS_PATH, render_dashboard_page
 from .libvirt_remote import LibvirtRemote, LibvirtRemoteError
 from .libvirt_cache import LibvirtCacheStore
+from .heartbeat_buffer import HeartbeatBuffer
+from .kvstore import build_kv_store
 from .vmware_compat import build_vmware_router
 from .auth import ensure_default_admin, login_get, login_post, logout_post, require_ui_auth
 from .console_service import build_console_urls
 
-app = FastAPI(title="KVM Dashboard API", version="0.7.1")
+app = FastAPI(title="KVM Dashboard API", version="0.7.1", default_response_class=ORJSONResponse)
 
 LIBVIRT_CACHE_TTL_S = int(os.getenv("LIBVIRT_CACHE_TTL_S", "60"))
 LIVE_STATUS_TTL_S = int(os.getenv("LIVE_STATUS_TTL_S", "15"))
+STATIC_JSON_MAX_AGE_S = int(os.getenv("STATIC_JSON_MAX_AGE_S", "300"))
+OVERVIEW_TTL_S = float(os.getenv("OVERVIEW_TTL_S", "5"))
 CONSOLE_SESSION_TTL_S = int(os.getenv("CONSOLE_SESSION_TTL_S", "30"))
+HOST_HEALTH_TTL_S = float(os.getenv("HOST_HEALTH_TTL_S", "2"))
+# Same cap LibvirtRemote applies to virsh; fan-outs stay within it instead of queueing on it.
+LIBVIRT_MAX_CONCURRENCY = max(1, int(os.getenv("LIBVIRT_MAX_CONCURRENCY", "2")))
+HOST_LOOKUP_TTL_S = float(os.getenv("HOST_LOOKUP_TTL_S", "5"))
+HOST_LOOKUP_CACHE_SIZE = 256
+# Covers a full host listing; the oldest entries are evicted beyond this.
+HOST_RESPONSE_CACHE_SIZE = 4096
+LIBVIRT_CLIENT_TTL_S = float(os.getenv("LIBVIRT_CLIENT_TTL_S", "300"))
+HEARTBEAT_FLUSH_INTERVAL_S = float(os.getenv("HEARTBEAT_FLUSH_INTERVAL_S", "0.25"))
 NOVNC_BASE_URL = os.getenv("NOVNC_BASE_URL", "/console/noVNC/viewer")
 NOVNC_WS_BASE = os.getenv("NOVNC_WS_BASE", "/console/noVNC/websockify")
 BASE_PATH = os.getenv("DASHBOARD_BASE_PATH", "").strip()
@@ -66,19 +97,39 @@ if BASE_PATH.endswith("/") and BASE_PATH != "/":
 
 PROJECTS: dict[str, ProjectRecord] = {}
 PROJECT_MEMBERS: dict[str, list[ProjectMemberRecord]] = {}
+PROJECT_MEMBER_IDS: dict[str, set[str]] = {}
 POLICIES: dict[str, PolicyRecord] = {}
-HOST_POLICY_BINDINGS: dict[str, list[str]] = {}
-PROJECT_POLICY_BINDINGS: dict[str, list[str]] = {}
-EVENTS: list[EventRecord] = []
-TASKS: dict[str, TaskRecord] = {}
-CONSOLE_SESSIONS: list[dict[str, str]] = []
-IMAGE_IMPORT_JOBS: list[dict[str, str]] = []
+# Policy bindings are insertion-ordered sets (dict keys with None values).
+HOST_POLICY_BINDINGS: dict[str, dict[str, None]] = {}
+PROJECT_POLICY_BINDINGS: dict[str, dict[str, None]] = {}
+# Parsed deny_actions per policy, filled when the policy is created.
+POLICY_DENY_ACTIONS: dict[str, frozenset[str]] = {}
+# (host_id, project_id) -> {denied action: name of the first policy denying it}.
+POLICY_DENY_CACHE: dict[tuple[str, str], dict[str, str]] = {}
+# (host_id, project_id) query -> serialized /policies/effective body; shares the deny cache's generation.
+EFFECTIVE_POLICIES_CACHE: dict[tuple[str | None, str | None], bytes] = {}
+EFFECTIVE_POLICIES_CACHE_SIZE = 1024
+_POLICY_DENY_GENERATION = 0
+_POLICY_DENY_LOCK = threading.Lock()
+# Events (newest first, capped) and tasks (by id) live in KV_STORE so workers can share them.
+EVENTS_KEY = "events"
+EVENTS_MAXLEN = 200
+# Each event is also pushed to "events:<type>" so type-filtered reads skip other types.
+EVENTS_BY_TYPE_PREFIX = "events:"
+TASKS_KEY = "tasks"
+KV_STORE = build_kv_store({EVENTS_KEY: EventRecord, TASKS_KEY: TaskRecord})
+# Rolling newest-first logs; appendleft drops the oldest entry once a deque is full.
+CONSOLE_SESSIONS: deque[dict[str, str]] = deque(maxlen=200)
+# (host_id, vm_id) -> (created epoch seconds, newest session for that VM).
+CONSOLE_SESSION_INDEX: dict[tuple[str, str], tuple[float, dict[str, str]]] = {}
+IMAGE_IMPORT_JOBS: deque[dict[str, str]] = deque(maxlen=500)
 RUNBOOK_TEMPLATES: dict[str, dict[str, Any]] = {}
 RUNBOOK_SCHEDULES: dict[str, dict[str, Any]] = {}
 EVENT_RETENTION_DAYS = 30
 VM_LIFECYCLE_POLICIES: dict[str, dict[str, Any]] = {}
-ADVANCED_NETWORK_CONFIG: dict[str, list[dict[str, Any]]] = {"vlan_trunks": [], "bridge_automation": [], "ipam": [], "security_policies": []}
-IMAGE_DEPLOYMENTS: list[dict[str, Any]] = []
+# section -> items keyed by id in insertion order; listed newest first.
+ADVANCED_NETWORK_CONFIG: dict[str, dict[str, dict[str, Any]]] = {"vlan_trunks": {}, "bridge_automation": {}, "ipam": {}, "security_policies": {}}
+IMAGE_DEPLOYMENTS: deque[dict[str, Any]] = deque(maxlen=500)
 VM_METADATA_OVERRIDES: dict[str, dict[str, dict[str, Any]]] = {}
 
 ROADMAP_PHASES: list[dict[str, object]] = [
@@ -122,62 +173,113 @@ PENDING_TASKS: list[dict[str, str]] = [
 ]
 
 CACHE_STORE = LibvirtCacheStore(ttl_s=LIBVIRT_CACHE_TTL_S)
+HEARTBEAT_BUFFER = HeartbeatBuffer(SessionLocal, flush_interval_s=HEARTBEAT_FLUSH_INTERVAL_S)
+# Fans out per-VM libvirt reads; virsh concurrency is still capped by LIBVIRT_MAX_CONCURRENCY.
+LIBVIRT_FANOUT_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="libvirt-fanout")
 LIVE_STATUS_CACHE: dict[str, Any] = {"updated_at": 0.0, "payload": None}
-
-
+# Host aggregates for /api/v1/overview; updated_at=0 forces the next request to re-query.
+OVERVIEW_CACHE: dict[str, Any] = {"updated_at": 0.0, "hosts": None}
+# Running (cpu, memory, vm_limit) quota totals across PROJECTS. Replaced as a
+# whole tuple so readers never see a partial update; writers hold the lock.
+_QUOTA_TOTALS: tuple[int, int, int] = (0, 0, 0)
+_QUOTA_LOCK = threading.Lock()
+HOST_HEALTH_CACHE: dict[str, tuple[float, dict[str, Any]]] = {}
+_HOST_HEALTH_INFLIGHT: dict[str, threading.Event] = {}
+_HOST_HEALTH_LOCK = threading.Lock()
+_LIBVIRT_CLIENTS: dict[str, tuple[float, LibvirtRemote]] = {}
+_LIBVIRT_CLIENTS_LOCK = threading.Lock()
+# Detached Host rows for the libvirt proxy endpoints, keyed by host_id.
+HOST_LOOKUP_CACHE: dict[str, tuple[float, Host]] = {}
+# host_id -> (last_heartbeat the response was built from, response).
+HOST_RESPONSE_CACHE: dict[str, tuple[datetime, HostResponse]] = {}
+# Guards both host caches above; _forget_cached_host evicts from them together.
+_HOST_CACHES_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=256)
 def _with_base(path: str) -> str:
     return f"{BASE_PATH}{path}" if BASE_PATH else path
 
 
-def _dashboard_route_hints() -> list[str]:
-    return [
-        _with_base("/"),
-        _with_base("/dashboard"),
-        _with_base("/vms"),
-        _with_base("/storage"),
-        _with_base("/console"),
-        _with_base("/networks"),
-        _with_base("/images"),
-        _with_base("/policies"),
-        _with_base("/events"),
-        _with_base("/tasks"),
-        _with_base("/healthz"),
-        _with_base("/api/v1/overview"),
-        _with_base("/api/v1/capabilities"),
-        _with_base("/api/v1/routes"),
-    ]
+_DASHBOARD_ROUTE_HINTS: tuple[str, ...] = tuple(
+    _with_base(path)
+    for path in (
+        "/",
+        "/dashboard",
+        "/vms",
+        "/storage",
+        "/console",
+        "/networks",
+        "/images",
+        "/policies",
+        "/events",
+        "/tasks",
+        "/healthz",
+        "/api/v1/overview",
+        "/api/v1/capabilities",
+        "/api/v1/routes",
+    )
+)
+
+
+def _dashboard_route_hints() -> tuple[str, ...]:
+    return _DASHBOARD_ROUTE_HINTS
 
 
+# API/docs/static/console prefixes plus exact reserved files. Leading and trailing slashes are
+# absorbed by the pattern, so "/api/" (nothing after the prefix) is not reserved.
+_RESERVED_PATH_RE = re.compile(r"^/*(?:(?:api|static)/+[^/]|(?:healthz|docs|redoc|console/noVNC)(?:/|$)|(?:openapi\.json|favicon\.ico)/*$)")
+
+
+@lru_cache(maxsize=2048)
 def _is_api_or_reserved_path(path: str) -> bool:
-    normalized = path.strip("/")
-    if not normalized:
-        return False
-    if normalized.startswith("api/"):
-        return True
-    if normalized.startswith("healthz/") or normalized.startswith("docs/") or normalized.startswith("redoc/"):
-        return True
-    return normalized in {"openapi.json", "docs", "docs/oauth2-redirect", "redoc", "healthz"}
+    return _RESERVED_PATH_RE.match(path) is not None
+
+
+def _newest(items: deque, limit: int | None = None) -> list:
+    """First ``limit`` entries of a rolling deque; copied first since other threads may append."""
+    snapshot = items.copy()
+    return list(snapshot) if limit is None else list(islice(snapshot, limit))
+
+
+# (epoch second, its ISO 8601 text); replaced as a whole so readers never see a torn pair.
+_NOW_ISO_CACHE: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time as ISO 8601 at second resolution, formatted once per second."""
+    global _NOW_ISO_CACHE
+    second = int(time.time())
+    cached = _NOW_ISO_CACHE
+    if cached[0] != second:
+        cached = _NOW_ISO_CACHE = (second, datetime.fromtimestamp(second, timezone.utc).isoformat())
+    return cached[1]
+
+
+def _record_counts() -> tuple[int, int]:
+    """Return (events, tasks); async handlers run it in a thread since the redis backend blocks."""
+    return KV_STORE.list_len(EVENTS_KEY), KV_STORE.hash_len(TASKS_KEY)
 
 
 def _record_event(event_type: str, message: str) -> EventRecord:
-    event = EventRecord(
-        event_id=str(uuid4()),
+    # Fields are produced here, not parsed from input, so skip validation.
+    event = EventRecord.model_construct(
+        event_id=secrets.token_hex(16),
         type=event_type,
         message=message,
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=_now_iso(),
     )
-    EVENTS.insert(0, event)
-    if len(EVENTS) > 200:
-        del EVENTS[200:]
+    KV_STORE.list_push(EVENTS_KEY, event, EVENTS_MAXLEN)
+    KV_STORE.list_push(f"{EVENTS_BY_TYPE_PREFIX}{event_type}", event, EVENTS_MAXLEN)
     return event
 
 
 
 
 def _create_completed_task(task_type: str, target: str, detail: str) -> TaskRecord:
-    now = datetime.now(timezone.utc).isoformat()
-    task = TaskRecord(
-        task_id=str(uuid4()),
+    now = _now_iso()
+    task = TaskRecord.model_construct(
+        task_id=secrets.token_hex(16),
         task_type=task_type,
         status="completed",
         target=target,
@@ -185,30 +287,88 @@ def _create_completed_task(task_type: str, target: str, detail: str) -> TaskReco
         created_at=now,
         completed_at=now,
     )
-    TASKS[task.task_id] = task
+    KV_STORE.hash_set(TASKS_KEY, task.task_id, task)
     return task
 
 
 def _resolve_effective_policies(host_id: str | None = None, project_id: str | None = None) -> list[PolicyRecord]:
-    host_policy_ids = HOST_POLICY_BINDINGS.get(host_id or "", [])
-    project_policy_ids = PROJECT_POLICY_BINDINGS.get(project_id or "", [])
-    resolved_ids = list(dict.fromkeys(host_policy_ids + project_policy_ids))
+    if not host_id and not project_id:
+        return []
+    resolved_ids = {**HOST_POLICY_BINDINGS.get(host_id, {}), **PROJECT_POLICY_BINDINGS.get(project_id, {})}
     return [POLICIES[policy_id] for policy_id in resolved_ids if policy_id in POLICIES]
 
 
-def _enforce_policies(action: str, host_id: str | None = None, project_id: str | None = None) -> None:
+def _parse_deny_actions(policy: PolicyRecord) -> frozenset[str]:
+    deny_actions = policy.spec.get("deny_actions") if isinstance(policy.spec, dict) else None
+    if isinstance(deny_actions, str):
+        return frozenset(item.strip() for item in deny_actions.split(",") if item.strip())
+    if isinstance(deny_actions, list):
+        return frozenset(str(item).strip() for item in deny_actions if str(item).strip())
+    return frozenset()
+
+
+def _invalidate_policy_deny_cache() -> None:
+    global _POLICY_DENY_GENERATION
+    with _POLICY_DENY_LOCK:
+        _POLICY_DENY_GENERATION += 1
+        POLICY_DENY_CACHE.clear()
+        EFFECTIVE_POLICIES_CACHE.clear()
+
+
+def _denied_actions(host_id: str | None, project_id: str | None) -> dict[str, str]:
+    key = (host_id or "", project_id or "")
+    with _POLICY_DENY_LOCK:
+        cached = POLICY_DENY_CACHE.get(key)
+        generation = _POLICY_DENY_GENERATION
+    if cached is not None:
+        return cached
+
+    denied: dict[str, str] = {}
     for policy in _resolve_effective_policies(host_id=host_id, project_id=project_id):
-        deny_actions = policy.spec.get("deny_actions") if isinstance(policy.spec, dict) else None
-        if isinstance(deny_actions, str):
-            blocked = {item.strip() for item in deny_actions.split(",") if item.strip()}
-        elif isinstance(deny_actions, list):
-            blocked = {str(item).strip() for item in deny_actions if str(item).strip()}
-        else:
-            blocked = set()
-        if action in blocked:
-            raise HTTPException(status_code=403, detail=f"policy {policy.name} blocks action '{action}'")
+        deny_actions = POLICY_DENY_ACTIONS.get(policy.policy_id)
+        if deny_actions is None:
+            deny_actions = _parse_deny_actions(policy)
+        for denied_action in deny_actions:
+            denied.setdefault(denied_action, policy.name)
+    with _POLICY_DENY_LOCK:
+        # A binding changed while we were resolving; don't store a stale answer.
+        if generation == _POLICY_DENY_GENERATION:
+            POLICY_DENY_CACHE[key] = denied
+    return denied
+
+
+def _enforce_policies(action: str, host_id: str | None = None, project_id: str | None = None) -> None:
+    policy_name = _denied_actions(host_id, project_id).get(action)
+    if policy_name is not None:
+        raise HTTPException(status_code=403, detail=f"policy {policy_name} blocks action '{action}'")
+
 
 
+def _record_json(record: EventRecord | TaskRecord) -> bytes:
+    """Encode a frozen event or task record once and reuse the bytes afterwards.
+
+    The records hold only plain str fields, so their ``__dict__`` is encoded
+    directly without going through the Pydantic serializer.
+    """
+    encoded = record._json
+    if encoded is None:
+        encoded = record._json = orjson.dumps(record.__dict__)
+    return encoded
+
+
+def _json_array_chunks(records: Iterable[Any], encode: Callable[[Any], bytes] = _record_json) -> Iterator[bytes]:
+    """Yield a JSON array one encoded record at a time."""
+    separator = b"["
+    for record in records:
+        yield separator + encode(record)
+        separator = b","
+    yield b"]" if separator == b"," else b"[]"
+
+
+def _stream_json_records(records: Iterable[Any]) -> StreamingResponse:
+    """Stream flat Pydantic records as a JSON array, serializing one record per chunk."""
+    return StreamingResponse(_json_array_chunks(records), media_type="application/json")
+
 
 def _actor_role(request: Request) -> str:
     return request.headers.get("x-role", "admin").strip().lower() or "admin"
@@ -225,14 +385,12 @@ def _tags_to_csv(tags: list[str] | None) -> str:
     return ",".join(sorted({t.strip() for t in tags if t and t.strip()}))
 
 
-def _csv_to_tags(tags_csv: str | None) -> list[str]:
-    if not tags_csv:
-        return []
-    return [item.strip() for item in tags_csv.split(",") if item.strip()]
-
-
 def _host_to_response(host: Host) -> HostResponse:
-    return HostResponse(
+    # Every write path to a host row also bumps last_heartbeat, so it versions the response.
+    cached = HOST_RESPONSE_CACHE.get(host.host_id)
+    if cached is not None and cached[0] == host.last_heartbeat:
+        return cached[1]
+    response = HostResponse.model_construct(
         host_id=host.host_id,
         name=host.name,
         address=host.address,
@@ -240,30 +398,140 @@ def _host_to_response(host: Host) -> HostResponse:
         cpu_cores=host.cpu_cores,
         memory_mb=host.memory_mb,
         libvirt_uri=host.libvirt_uri,
-        tags=_csv_to_tags(getattr(host, "tags", "")),
+        tags=host.tag_list,
         project_id=getattr(host, "project_id", None),
         last_heartbeat=host.last_heartbeat,
     )
+    with _HOST_CACHES_LOCK:
+        if host.host_id not in HOST_RESPONSE_CACHE and len(HOST_RESPONSE_CACHE) >= HOST_RESPONSE_CACHE_SIZE:
+            HOST_RESPONSE_CACHE.pop(next(iter(HOST_RESPONSE_CACHE)))
+        HOST_RESPONSE_CACHE[host.host_id] = (host.last_heartbeat, response)
+    return response
+
+
+_READY_HOST_STATUSES = ("ready", "registered")
+
+
+_HOST_AGGREGATES = select(
+    func.count(Host.id),
+    func.coalesce(func.sum(case((Host.status.in_(_READY_HOST_STATUSES), 1), else_=0)), 0),
+    func.coalesce(func.sum(Host.cpu_cores), 0),
+    func.coalesce(func.sum(Host.memory_mb), 0),
+)
+
+
+def _host_aggregates(db: Session) -> tuple[int, int, int, int]:
+    """Return (total, ready, cpu_cores, memory_mb) for all hosts in one query."""
+    total, ready, cpu_cores, memory_mb = db.execute(_HOST_AGGREGATES).one()
+    return int(total), int(ready), int(cpu_cores), int(memory_mb)
+
+
+async def _host_aggregates_async(db: AsyncSession) -> tuple[int, int, int, int]:
+    total, ready, cpu_cores, memory_mb = (await db.execute(_HOST_AGGREGATES)).one()
+    return int(total), int(ready), int(cpu_cores), int(memory_mb)
+
+
+async def _cached_host_aggregates(db: AsyncSession) -> tuple[int, int, int, int]:
+    """Host aggregates for the read-only status endpoints, reused for OVERVIEW_TTL_S."""
+    now_ts = time.monotonic()
+    aggregates = OVERVIEW_CACHE["hosts"]
+    if aggregates is None or now_ts - OVERVIEW_CACHE["updated_at"] > OVERVIEW_TTL_S:
+        aggregates = await _host_aggregates_async(db)
+        OVERVIEW_CACHE["hosts"] = aggregates
+        OVERVIEW_CACHE["updated_at"] = now_ts
+    return aggregates
 
 
 def _project_quota_summary() -> tuple[int, int, int]:
-    total_cpu = sum(project.cpu_cores_quota for project in PROJECTS.values())
-    total_memory = sum(project.memory_mb_quota for project in PROJECTS.values())
-    total_vm_limit = sum(project.vm_limit for project in PROJECTS.values())
-    return total_cpu, total_memory, total_vm_limit
+    return _QUOTA_TOTALS
+
+
+def _store_project(project: ProjectRecord) -> None:
+    global _QUOTA_TOTALS
+    with _QUOTA_LOCK:
+        total_cpu, total_memory, total_vm_limit = _QUOTA_TOTALS
+        PROJECTS[project.project_id] = project
+        _QUOTA_TOTALS = (
+            total_cpu + project.cpu_cores_quota,
+            total_memory + project.memory_mb_quota,
+            total_vm_limit + project.vm_limit,
+        )
+
+
+def _update_project_quota(project: ProjectRecord, cpu_cores: int, memory_mb: int, vm_limit: int) -> None:
+    """Update a stored project's quota in place and adjust the running totals."""
+    global _QUOTA_TOTALS
+    with _QUOTA_LOCK:
+        total_cpu, total_memory, total_vm_limit = _QUOTA_TOTALS
+        _QUOTA_TOTALS = (
+            total_cpu - project.cpu_cores_quota + cpu_cores,
+            total_memory - project.memory_mb_quota + memory_mb,
+            total_vm_limit - project.vm_limit + vm_limit,
+        )
+        project.cpu_cores_quota = cpu_cores
+        project.memory_mb_quota = memory_mb
+        project.vm_limit = vm_limit
+
+
+# Columns added to hosts after its first release, with their DDL.
+_HOST_LATE_COLUMNS = {
+    "tags": "tags VARCHAR(1024) DEFAULT ''",
+    "project_id": "project_id VARCHAR(128)",
+}
+
+
+def _ensure_host_columns(db: Session) -> None:
+    """Add late hosts columns in one ALTER, and only when some are actually missing."""
+    existing = {column["name"] for column in inspect(db.get_bind()).get_columns("hosts")}
+    missing = [ddl for name, ddl in _HOST_LATE_COLUMNS.items() if name not in existing]
+    if not missing:
+        return
+    db.execute(text("ALTER TABLE hosts " + ", ".join(f"ADD COLUMN IF NOT EXISTS {ddl}" for ddl in missing)))
+    db.commit()
+
+
+# Rendered inline (not as bind params) so Postgres can match it to hosts_tags_trgm.
+_HOST_TAGS_DELIMITED = literal_column("','") + Host.tags + literal_column("','")
+
+
+def _ensure_host_tags_index(db: Session) -> None:
+    """Back the list_hosts tag filter with a trigram index on Postgres."""
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    try:
+        db.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        db.execute(text("CREATE INDEX IF NOT EXISTS hosts_tags_trgm ON hosts USING gin ((',' || tags || ',') gin_trgm_ops)"))
+        db.commit()
+    except SQLAlchemyError:
+        # pg_trgm missing or not permitted: the tag filter still works, just unindexed.
+        db.rollback()
+
+
+def _ensure_session_index(db: Session) -> None:
+    """Bring older databases to the current session-table indexes.
+
+    Creates missing ones, such as (token, expires_at), and drops the single-column
+    expires_at index the composite one replaces.
+    """
+    for index in DashboardSession.__table__.indexes:
+        index.create(bind=db.connection(), checkfirst=True)
+    db.execute(text("DROP INDEX IF EXISTS ix_dashboard_sessions_expires_at"))
+    db.commit()
 
 
 @app.on_event("startup")
 def startup() -> None:
+    # Every router is mounted by now; build the route listing before the first request.
+    _routes_body()
     init_db()
     db_gen = get_db()
     try:
         db = next(db_gen)
         CACHE_STORE.ensure_table(db)
-        db.execute(text("ALTER TABLE hosts ADD COLUMN IF NOT EXISTS tags VARCHAR(1024) DEFAULT ''"))
-        db.execute(text("ALTER TABLE hosts ADD COLUMN IF NOT EXISTS project_id VARCHAR(128)"))
-        db.commit()
+        _ensure_host_columns(db)
         ensure_default_admin(db)
+        _ensure_host_tags_index(db)
+        _ensure_session_index(db)
     except Exception:
         pass
     finally:
@@ -273,15 +541,45 @@ def startup() -> None:
             pass
 
 
-@app.middleware("http")
-async def strip_base_path_middleware(request: Request, call_next):
-    if BASE_PATH and BASE_PATH != "/":
-        path = request.scope.get("path", "")
-        if path == BASE_PATH or path.startswith(f"{BASE_PATH}/"):
-            rewritten = path[len(BASE_PATH):] or "/"
-            request.scope["path"] = rewritten
-            request.scope["raw_path"] = rewritten.encode("utf-8")
-    return await call_next(request)
+@app.on_event("shutdown")
+def shutdown() -> None:
+    HEARTBEAT_BUFFER.stop()
+    LIBVIRT_FANOUT_POOL.shutdown(wait=False)
+
+
+@app.on_event("shutdown")
+async def shutdown_async_db() -> None:
+    await dispose_async_engine()
+
+
+_BASE_PATH_PREFIX = f"{BASE_PATH}/"
+_BASE_PATH_LEN = len(BASE_PATH)
+_BASE_PATH_RAW = BASE_PATH.encode("utf-8")
+_BASE_PATH_RAW_LEN = len(_BASE_PATH_RAW)
+
+
+class StripBasePathMiddleware:
+    """Plain ASGI middleware that strips BASE_PATH from incoming HTTP paths."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] == "http":
+            path = scope.get("path", "")
+            if path == BASE_PATH or path.startswith(_BASE_PATH_PREFIX):
+                scope["path"] = path[_BASE_PATH_LEN:] or "/"
+                raw_path = scope.get("raw_path")
+                # Slice the original bytes so percent-encoding in the rest of the path survives.
+                if raw_path is not None and raw_path.startswith(_BASE_PATH_RAW):
+                    scope["raw_path"] = raw_path[_BASE_PATH_RAW_LEN:] or b"/"
+                else:
+                    scope["raw_path"] = scope["path"].encode("utf-8")
+        await self.app(scope, receive, send)
+
+
+if BASE_PATH and BASE_PATH != "/":
+    app.add_middleware(StripBasePathMiddleware)
 
 
 @app.get("/healthz")
@@ -305,24 +603,36 @@ def dashboard_login_submit(username: str = Form(...), password: str = Form(...),
 def dashboard_logout(request: Request, db: Session = Depends(get_db)):
     return logout_post(request=request, db=db)
 
+_HOST_ACTION_STATUS: dict[HostAction, str] = {
+    HostAction.mark_ready: "ready",
+    HostAction.mark_maintenance: "maintenance",
+    HostAction.mark_draining: "draining",
+    HostAction.disable: "disabled",
+}
+
+
 def _apply_host_action(host: Host, action: HostAction) -> None:
-    if action == HostAction.mark_ready:
-        host.status = "ready"
-    elif action == HostAction.mark_maintenance:
-        host.status = "maintenance"
-    elif action == HostAction.mark_draining:
-        host.status = "draining"
-    elif action == HostAction.disable:
-        host.status = "disabled"
+    status = _HOST_ACTION_STATUS.get(action)
+    if status is not None:
+        host.status = status
 
 
 
 
 def _libvirt_or_502(host: Host) -> LibvirtRemote:
+    # LibvirtRemote keeps no connection state, so one client per URI is shared across threads.
+    now = time.monotonic()
+    with _LIBVIRT_CLIENTS_LOCK:
+        cached = _LIBVIRT_CLIENTS.get(host.libvirt_uri)
+        if cached and now - cached[0] < LIBVIRT_CLIENT_TTL_S:
+            return cached[1]
     try:
-        return LibvirtRemote(host.libvirt_uri)
+        client = LibvirtRemote(host.libvirt_uri)
     except Exception as exc:
         raise HTTPException(status_code=502, detail=f"libvirt init failed: {exc}") from exc
+    with _LIBVIRT_CLIENTS_LOCK:
+        _LIBVIRT_CLIENTS[host.libvirt_uri] = (now, client)
+    return client
 
 
 def _libvirt_call(host: Host, fn_name: str, *args):
@@ -335,6 +645,30 @@ def _libvirt_call(host: Host, fn_name: str, *args):
 
 
 
+def _host_health(host: Host) -> dict[str, Any]:
+    """Return libvirt health for a host, sharing one probe between concurrent callers."""
+    while True:
+        with _HOST_HEALTH_LOCK:
+            cached = HOST_HEALTH_CACHE.get(host.host_id)
+            if cached and time.monotonic() - cached[0] < HOST_HEALTH_TTL_S:
+                return cached[1]
+            inflight = _HOST_HEALTH_INFLIGHT.get(host.host_id)
+            if inflight is None:
+                inflight = _HOST_HEALTH_INFLIGHT[host.host_id] = threading.Event()
+                break
+        inflight.wait()
+
+    try:
+        status = _libvirt_call(host, "health")
+        with _HOST_HEALTH_LOCK:
+            HOST_HEALTH_CACHE[host.host_id] = (time.monotonic(), status)
+        return status
+    finally:
+        with _HOST_HEALTH_LOCK:
+            _HOST_HEALTH_INFLIGHT.pop(host.host_id, None)
+        inflight.set()
+
+
 def _refresh_host_cache(db: Session, host: Host) -> dict[str, Any]:
     return CACHE_STORE.refresh(db, host, _libvirt_call)
 
@@ -347,6 +681,55 @@ def _host_cached_state(db: Session, host: Host, *, force_refresh: bool = False)
     return CACHE_STORE.get(db, host, _libvirt_call, force_refresh=force_refresh)
 
 
+def _apply_pending_heartbeat(host: Host) -> None:
+    pending = HEARTBEAT_BUFFER.pop(host.host_id)
+    if pending:
+        for field, value in pending.items():
+            setattr(host, field, value)
+
+
+def _snapshot_lists(host: Host, vm_ids: list[str]) -> dict[str, Any]:
+    """Fetch snapshot lists for several VMs concurrently; a failing VM reports none."""
+
+    def fetch(vm_id: str) -> Any:
+        try:
+            return _libvirt_call(host, "snapshot_list", vm_id)
+        except HTTPException:
+            return []
+
+    return dict(zip(vm_ids, LIBVIRT_FANOUT_POOL.map(fetch, vm_ids)))
+
+
+def _cached_state_response(request: Request, state: dict[str, Any], payload: dict[str, Any]) -> Response:
+    """Return payload with an ETag derived from the libvirt cache row, or 304 if the client has it."""
+    error_crc = zlib.crc32((state.get("last_error") or "").encode())
+    etag = f'W/"{int(state["updated_at"] * 1000)}-{state["cache"]}-{error_crc:x}"'
+    # no-cache: clients may keep the body but must revalidate, so writes show up immediately.
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(payload, headers=headers)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    return bool(if_none_match) and etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def _static_json(payload: Any) -> tuple[bytes, str]:
+    """Encode a payload that never changes at runtime, with a strong ETag over its bytes."""
+    body = orjson.dumps(payload)
+    return body, f'"{zlib.crc32(body):08x}"'
+
+
+def _static_json_response(request: Request, static: tuple[bytes, str]) -> Response:
+    body, etag = static
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={STATIC_JSON_MAX_AGE_S}"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 def _get_host_or_404(db: Session, host_id: str) -> Host:
     host = db.query(Host).filter(Host.host_id == host_id).first()
     if not host:
@@ -354,14 +737,45 @@ def _get_host_or_404(db: Session, host_id: str) -> Host:
     return host
 
 
-def _render_ui_page(page: str, db: Session) -> str:
-    hosts = db.query(Host).order_by(Host.id.desc()).all()
-    stats = {
-        "hosts": len(hosts),
-        "ready_hosts": len([host for host in hosts if host.status in {"ready", "registered"}]),
-        "policies": len(POLICIES),
-    }
-    return render_dashboard_page(page, base_path=BASE_PATH, stats=stats)
+def _get_host_cached(db: Session, host_id: str) -> Host:
+    """Look up a host for read-only use, reusing a recent detached copy.
+
+    Handlers that modify the host must keep using _get_host_or_404 so they
+    work on an instance bound to their session.
+    """
+    now = time.monotonic()
+    with _HOST_CACHES_LOCK:
+        cached = HOST_LOOKUP_CACHE.get(host_id)
+        if cached and now - cached[0] < HOST_LOOKUP_TTL_S:
+            return cached[1]
+
+    host = _get_host_or_404(db, host_id)
+    db.expunge(host)
+    with _HOST_CACHES_LOCK:
+        if host_id not in HOST_LOOKUP_CACHE and len(HOST_LOOKUP_CACHE) >= HOST_LOOKUP_CACHE_SIZE:
+            HOST_LOOKUP_CACHE.pop(next(iter(HOST_LOOKUP_CACHE)))
+        HOST_LOOKUP_CACHE[host_id] = (now, host)
+    return host
+
+
+def _forget_cached_host(host_id: str) -> None:
+    with _HOST_CACHES_LOCK:
+        HOST_LOOKUP_CACHE.pop(host_id, None)
+        HOST_RESPONSE_CACHE.pop(host_id, None)
+    OVERVIEW_CACHE["updated_at"] = 0.0
+
+
+@lru_cache(maxsize=64)
+def _rendered_ui_page(page: str, hosts: int, ready_hosts: int, policies: int) -> bytes:
+    # The HTML depends only on these arguments and BASE_PATH, so the key is the whole input.
+    # Cached as UTF-8 so responses skip re-encoding the page on every hit.
+    html = render_dashboard_page(page, base_path=BASE_PATH, stats={"hosts": hosts, "ready_hosts": ready_hosts, "policies": policies})
+    return html.encode("utf-8")
+
+
+def _render_ui_page(page: str, db: Session) -> HTMLResponse:
+    hosts, ready_hosts, _, _ = _host_aggregates(db)
+    return HTMLResponse(_rendered_ui_page(page, hosts, ready_hosts, len(POLICIES)))
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -371,10 +785,16 @@ def _render_ui_page(page: str, db: Session) -> str:
 @app.get("/ui/", response_class=HTMLResponse)
 @app.get("/index.html", response_class=HTMLResponse)
 @app.get("/home", response_class=HTMLResponse)
-def dashboard_home(_user=Depends(require_ui_auth), db: Session = Depends(get_db)) -> str:
+def dashboard_home(_user=Depends(require_ui_auth), db: Session = Depends(get_db)) -> HTMLResponse:
     return _render_ui_page("dashboard", db)
 
 
+@app.get(DASHBOARD_CSS_PATH, include_in_schema=False)
+def dashboard_css() -> Response:
+    # Pages link it with a content hash query, so any cached copy is still current for that URL.
+    return Response(content=DASHBOARD_CSS, media_type="text/css", headers={"Cache-Control": "public, max-age=31536000, immutable"})
+
+
 @app.get("/vms", response_class=HTMLResponse)
 @app.get("/storage", response_class=HTMLResponse)
 @app.get("/console", response_class=HTMLResponse)
@@ -384,7 +804,7 @@ def dashboard_home(_user=Depends(require_ui_auth), db: Session = Depends(get_db)
 @app.get("/events", response_class=HTMLResponse)
 @app.get("/tasks", response_class=HTMLResponse)
 @app.get("/guide", response_class=HTMLResponse)
-def dashboard_sections(request: Request, _user=Depends(require_ui_auth), db: Session = Depends(get_db)) -> str:
+def dashboard_sections(request: Request, _user=Depends(require_ui_auth), db: Session = Depends(get_db)) -> HTMLResponse:
     page = request.url.path.strip("/").split("/")[0] or "dashboard"
     return _render_ui_page(page, db)
 
@@ -392,153 +812,209 @@ def dashboard_sections(request: Request, _user=Depends(require_ui_auth), db: Ses
 @app.post("/hosts/{host_id}/action-web")
 def host_action_web(host_id: str, action: HostAction = Form(...), db: Session = Depends(get_db)) -> RedirectResponse:
     host = _get_host_or_404(db, host_id)
+    _apply_pending_heartbeat(host)
     _apply_host_action(host, action)
     host.last_heartbeat = datetime.now(timezone.utc)
     db.commit()
+    _forget_cached_host(host_id)
     return RedirectResponse(url="/", status_code=303)
 
 
+# Dialect inserts that support ON CONFLICT ... DO UPDATE, for the register upsert.
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
 @app.post("/api/v1/hosts/register", response_model=HostResponse)
 def register_host(payload: HostRegisterRequest, db: Session = Depends(get_db)) -> Host:
-    host = db.query(Host).filter(Host.host_id == payload.host_id).first()
-
-    if host:
-        host.name = payload.name
-        host.address = payload.address
-        host.cpu_cores = payload.cpu_cores
-        host.memory_mb = payload.memory_mb
-        host.libvirt_uri = payload.libvirt_uri
-        host.tags = _tags_to_csv(payload.tags)
-        host.project_id = payload.project_id
-        host.status = "registered"
-        host.last_heartbeat = datetime.now(timezone.utc)
-    else:
-        host = Host(
-            host_id=payload.host_id,
-            name=payload.name,
-            address=payload.address,
-            status="registered",
-            cpu_cores=payload.cpu_cores,
-            memory_mb=payload.memory_mb,
-            libvirt_uri=payload.libvirt_uri,
-            tags=_tags_to_csv(payload.tags),
-            project_id=payload.project_id,
-            last_heartbeat=datetime.now(timezone.utc),
-        )
-        db.add(host)
+    HEARTBEAT_BUFFER.pop(payload.host_id)
+    values = {
+        "name": payload.name,
+        "address": payload.address,
+        "status": "registered",
+        "cpu_cores": payload.cpu_cores,
+        "memory_mb": payload.memory_mb,
+        "libvirt_uri": payload.libvirt_uri,
+        "tags": _tags_to_csv(payload.tags),
+        "project_id": payload.project_id,
+        "last_heartbeat": datetime.now(timezone.utc),
+    }
+    insert = _UPSERT_INSERTS[db.get_bind().dialect.name]
+    stmt = (
+        insert(Host)
+        .values(host_id=payload.host_id, **values)
+        .on_conflict_do_update(index_elements=[Host.host_id], set_=values)
+        .returning(Host)
+        .execution_options(populate_existing=True)
+    )
+    host = db.execute(stmt).scalar_one()
 
+    # Build the response before commit expires the instance.
+    response = _host_to_response(host)
     db.commit()
-    db.refresh(host)
-    return _host_to_response(host)
+    _forget_cached_host(payload.host_id)
+    return response
 
 
 @app.post("/api/v1/hosts/{host_id}/heartbeat", response_model=HostResponse)
 def heartbeat(host_id: str, payload: HeartbeatRequest, db: Session = Depends(get_db)) -> Host:
     host = _get_host_or_404(db, host_id)
+    now = datetime.now(timezone.utc)
+    HEARTBEAT_BUFFER.put(host_id, status=payload.status, cpu_cores=payload.cpu_cores, memory_mb=payload.memory_mb, last_heartbeat=now)
+    # The buffer owns the write; the session is discarded without a commit.
     host.status = payload.status
     host.cpu_cores = payload.cpu_cores
     host.memory_mb = payload.memory_mb
-    host.last_heartbeat = datetime.now(timezone.utc)
-    db.commit()
-    db.refresh(host)
+    host.last_heartbeat = now
     return _host_to_response(host)
 
 
 @app.post("/api/v1/hosts/{host_id}/action", response_model=HostResponse)
 def host_action(host_id: str, payload: HostActionRequest, db: Session = Depends(get_db)) -> Host:
     host = _get_host_or_404(db, host_id)
+    _apply_pending_heartbeat(host)
     _apply_host_action(host, payload.action)
     host.last_heartbeat = datetime.now(timezone.utc)
+    response = _host_to_response(host)
     db.commit()
-    db.refresh(host)
-    return _host_to_response(host)
+    _forget_cached_host(host_id)
+    return response
 
 
 @app.delete("/api/v1/hosts/{host_id}")
 def remove_host(host_id: str, db: Session = Depends(get_db)) -> dict[str, str]:
     host = _get_host_or_404(db, host_id)
+    HEARTBEAT_BUFFER.pop(host_id)
     db.delete(host)
     db.commit()
+    _forget_cached_host(host_id)
     return {"status": "deleted", "host_id": host_id}
 
 
+# Columns read by _host_to_response; created_at is never needed for listings. Touching an
+# unloaded attribute raises instead of issuing one extra SELECT per row.
+_HOST_RESPONSE_COLUMNS = load_only(
+    Host.host_id,
+    Host.name,
+    Host.address,
+    Host.status,
+    Host.cpu_cores,
+    Host.memory_mb,
+    Host.libvirt_uri,
+    Host.tags,
+    Host.project_id,
+    Host.last_heartbeat,
+    raiseload=True,
+)
+
+
 @app.get("/api/v1/hosts", response_model=list[HostResponse])
 def list_hosts(project_id: str | None = Query(default=None), tag: str | None = Query(default=None), db: Session = Depends(get_db)) -> list[HostResponse]:
-    query = db.query(Host)
+    query = db.query(Host).options(_HOST_RESPONSE_COLUMNS)
     if project_id:
         query = query.filter(Host.project_id == project_id)
-    hosts = query.order_by(Host.id.desc()).all()
     if tag:
-        token = tag.strip().lower()
-        hosts = [h for h in hosts if token in {t.lower() for t in _csv_to_tags(getattr(h, "tags", ""))}]
+        token = tag.strip()
+        if not token or "," in token:
+            # Tags are stored comma-separated and stripped, so these can never match.
+            query = query.filter(false())
+        else:
+            # Wrapping the CSV in commas makes ",tag," an exact, case-insensitive element match.
+            query = query.filter(_HOST_TAGS_DELIMITED.icontains(f",{token},", autoescape=True))
+    hosts = query.order_by(Host.id.desc()).all()
     return [_host_to_response(h) for h in hosts]
 
 
 @app.post("/api/v1/vms/provision")
-def provision_vm(payload: VMProvisionRequest, db: Session = Depends(get_db)) -> dict:
+def provision_vm(payload: VMProvisionRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> dict:
     _enforce_policies("vm.provision", host_id=payload.host_id)
-    host = _get_host_or_404(db, payload.host_id)
+    host = _get_host_cached(db, payload.host_id)
     vm = _libvirt_call(host, "create_vm", payload.name, payload.cpu_cores, payload.memory_mb, payload.image, payload.network, payload.disk_path, payload.cdrom, payload.disk_size_gb, payload.enable_guest_agent)
     _mark_host_cache_stale(db, host)
-    _record_event("vm.provision", f"vm {payload.name} created on host {payload.host_id}")
-    _create_completed_task("vm.provision", payload.name, f"created cpu={payload.cpu_cores},mem={payload.memory_mb},image={payload.image},network={payload.network}")
+    background_tasks.add_task(_record_event, "vm.provision", f"vm {payload.name} created on host {payload.host_id}")
+    background_tasks.add_task(_create_completed_task, "vm.provision", payload.name, f"created cpu={payload.cpu_cores},mem={payload.memory_mb},image={payload.image},network={payload.network}")
     return {"host_id": payload.host_id, "vm": vm, "status": "created"}
 
 
 @app.post("/api/v1/vms/import")
-def import_vm(payload: VMImportRequest, db: Session = Depends(get_db)) -> dict:
+def import_vm(payload: VMImportRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> dict:
     _enforce_policies("vm.import", host_id=payload.host_id)
-    _get_host_or_404(db, payload.host_id)
-    _record_event("vm.import", f"vm {payload.name} import requested on host {payload.host_id}")
-    _create_completed_task("vm.import", payload.vm_id, "manual libvirt import required (domain XML + disk)")
+    _get_host_cached(db, payload.host_id)
+    background_tasks.add_task(_record_event, "vm.import", f"vm {payload.name} import requested on host {payload.host_id}")
+    background_tasks.add_task(_create_completed_task, "vm.import", payload.vm_id, "manual libvirt import required (domain XML + disk)")
     return {"host_id": payload.host_id, "vm": payload.model_dump(), "note": "import metadata recorded"}
 
 
 @app.get("/api/v1/hosts/{host_id}/vms")
-def list_host_vms(host_id: str, refresh: bool = False, db: Session = Depends(get_db)) -> dict:
-    host = _get_host_or_404(db, host_id)
+def list_host_vms(host_id: str, request: Request, refresh: bool = False, db: Session = Depends(get_db)) -> Response:
+    host = _get_host_cached(db, host_id)
     state = _host_cached_state(db, host, force_refresh=refresh)
-    return {"host_id": host_id, "vms": state["vms"], "cache": state["cache"], "cached_at": state["updated_at"], "last_error": state.get("last_error"), "last_success_at": state.get("last_success_at")}
+    return _cached_state_response(request, state, {"host_id": host_id, "vms": state["vms"], "cache": state["cache"], "cached_at": state["updated_at"], "last_error": state.get("last_error"), "last_success_at": state.get("last_success_at")})
+
+
+@app.get("/api/v1/hosts/{host_id}/vms/stream")
+def stream_host_vms(host_id: str, refresh: bool = False, db: Session = Depends(get_db)) -> StreamingResponse:
+    """NDJSON variant of list_host_vms: one VM object per line, encoded as it is sent."""
+    host = _get_host_cached(db, host_id)
+    vms = _host_cached_state(db, host, force_refresh=refresh)["vms"]
+
+    def lines() -> Iterator[bytes]:
+        for vm in vms:
+            yield orjson.dumps(vm, option=orjson.OPT_APPEND_NEWLINE)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @app.get("/api/v1/hosts/{host_id}/inventory-live")
-def host_inventory_live(host_id: str, refresh: bool = False, include_snapshots: bool = False, db: Session = Depends(get_db)) -> dict:
-    host = _get_host_or_404(db, host_id)
+def host_inventory_live(host_id: str, request: Request, refresh: bool = False, include_snapshots: bool = False, db: Session = Depends(get_db)) -> Response:
+    host = _get_host_cached(db, host_id)
     state = _host_cached_state(db, host, force_refresh=refresh)
     vms, networks, images = state["vms"], state["networks"], state["images"]
     vm_snapshots: dict[str, Any] = {}
     if include_snapshots:
-        for vm in vms:
-            vm_id = vm.get("vm_id")
-            if vm_id:
-                vm_snapshots[vm_id] = _libvirt_call(host, "snapshot_list", vm_id)
-    attachments = {vm.get("vm_id"): {"networks": vm.get("networks", []), "image": {"name": vm.get("image")}, "snapshots": vm_snapshots.get(vm.get("vm_id"), [])} for vm in vms if vm.get("vm_id")}
-    return {"host_id": host_id, "cache": state["cache"], "cached_at": state["updated_at"], "last_error": state.get("last_error"), "last_success_at": state.get("last_success_at"), "state": {"vm_count": len(vms), "network_count": len(networks), "image_count": len(images), "snapshot_count": sum(len(items) for items in vm_snapshots.values())}, "vms": vms, "networks": networks, "images": images, "attachments": attachments}
+        vm_snapshots = _snapshot_lists(host, [vm["vm_id"] for vm in vms if vm.get("vm_id")])
+    attachments: dict[str, Any] = {}
+    for vm in vms:
+        vm_id = vm.get("vm_id")
+        if not vm_id:
+            continue
+        # Empty tuples serialize as [] and avoid allocating a fresh list per VM.
+        attachments[vm_id] = {"networks": vm.get("networks", ()), "image": {"name": vm.get("image")}, "snapshots": vm_snapshots.get(vm_id, ())}
+    payload = {"host_id": host_id, "cache": state["cache"], "cached_at": state["updated_at"], "last_error": state.get("last_error"), "last_success_at": state.get("last_success_at"), "state": {"vm_count": len(vms), "network_count": len(networks), "image_count": len(images), "snapshot_count": sum(map(len, vm_snapshots.values()))}, "vms": vms, "networks": networks, "images": images, "attachments": attachments}
+    if include_snapshots:
+        # Snapshots come straight from libvirt, so the cache row can't version them.
+        return ORJSONResponse(payload)
+    return _cached_state_response(request, state, payload)
 
 
 @app.get("/api/v1/vms/{vm_id}/attachments")
 def vm_attachments(vm_id: str, host_id: str, refresh: bool = False, db: Session = Depends(get_db)) -> dict:
-    host = _get_host_or_404(db, host_id)
+    host = _get_host_cached(db, host_id)
     state = _host_cached_state(db, host)
     vm = next((item for item in state["vms"] if item.get("vm_id") == vm_id), None)
     if not vm:
         raise HTTPException(status_code=404, detail="vm not found")
 
-    snapshots = _libvirt_call(host, "snapshot_list", vm_id) if refresh else []
+    snapshots: Any = []
+    current_iso = ""
+    if refresh:
+        snapshots_future = LIBVIRT_FANOUT_POOL.submit(_libvirt_call, host, "snapshot_list", vm_id)
+        current_iso = _libvirt_call(host, "current_iso", vm_id)
+        snapshots = snapshots_future.result()
     networks = state["networks"]
     images = state["images"]
 
-    attached_networks = [net for net in networks if net.get("name") in vm.get("networks", [])]
+    vm_networks = set(vm.get("networks", []))
+    attached_networks = [net for net in networks if net.get("name") in vm_networks]
     image_record = next((img for img in images if img.get("name") in {vm.get("image"), f"{vm.get('image', '')}.qcow2"}), None)
 
-    override = VM_METADATA_OVERRIDES.get(host_id, {}).get(vm_id, {"labels": {}, "annotations": {}})
+    override = VM_METADATA_OVERRIDES.get(host_id, {}).get(vm_id)
     volume_name = f"{vm.get('name', 'vm')}-{vm_id[:8]}.qcow2"
-    current_iso = _libvirt_call(host, "current_iso", vm_id) if refresh else ""
     return {
         "host_id": host_id,
         "vm_id": vm_id,
         "power_state": vm.get("power_state"),
-        "vm": {**vm, **override},
+        # vm is decoded fresh from the cache row, so it can be returned as-is without an override.
+        "vm": vm if override is None else {**vm, **override},
         "attachments": {
             "image": image_record,
             "networks": attached_networks,
@@ -550,117 +1026,117 @@ def vm_attachments(vm_id: str, host_id: str, refresh: bool = False, db: Session
 
 
 @app.post("/api/v1/vms/{vm_id}/action")
-def vm_action(vm_id: str, payload: VMHostActionRequest, db: Session = Depends(get_db)) -> dict:
+def vm_action(vm_id: str, payload: VMHostActionRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> dict:
     _enforce_policies(f"vm.action.{payload.action.value}", host_id=payload.host_id)
-    host = _get_host_or_404(db, payload.host_id)
+    host = _get_host_cached(db, payload.host_id)
     _libvirt_call(host, "vm_action", vm_id, payload.action.value)
     _mark_host_cache_stale(db, host)
-    _record_event("vm.action", f"vm {vm_id} action={payload.action.value} on host {payload.host_id}")
+    background_tasks.add_task(_record_event, "vm.action", f"vm {vm_id} action={payload.action.value} on host {payload.host_id}")
     return {"host_id": payload.host_id, "vm": {"vm_id": vm_id, "power_state": "changed", "cache": "stale"}}
 
 
 @app.delete("/api/v1/vms/{vm_id}")
 def delete_vm(vm_id: str, host_id: str, db: Session = Depends(get_db)) -> dict:
-    host = _get_host_or_404(db, host_id)
+    host = _get_host_cached(db, host_id)
     _libvirt_call(host, "delete_vm", vm_id)
     _mark_host_cache_stale(db, host)
     return {"host_id": host_id, "result": {"status": "deleted", "vm_id": vm_id}}
 
 
 @app.post("/api/v1/networks")
-def create_network(payload: NetworkCreateRequest, request: Request, db: Session = Depends(get_db)) -> dict:
+def create_network(payload: NetworkCreateRequest, request: Request, background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> dict:
     _require_roles(request, {"admin", "operator"})
     _enforce_policies("network.create", host_id=payload.host_id)
-    host = _get_host_or_404(db, payload.host_id)
+    host = _get_host_cached(db, payload.host_id)
     network = _libvirt_call(host, "create_network", payload.name, payload.cidr, payload.vlan_id)
     _mark_host_cache_stale(db, host)
-    _record_event("network.create", f"network {payload.name} created on host {payload.host_id}")
-    _create_completed_task("network.create", payload.name, f"cidr={payload.cidr},vlan={payload.vlan_id}")
+    background_tasks.add_task(_record_event, "network.create", f"network {payload.name} created on host {payload.host_id}")
+    background_tasks.add_task(_create_completed_task, "network.create", payload.name, f"cidr={payload.cidr},vlan={payload.vlan_id}")
     return {"host_id": payload.host_id, "network": network}
 
 
 @app.get("/api/v1/hosts/{host_id}/networks")
-def list_host_networks(host_id: str, refresh: bool = False, db: Session = Depends(get_db)) -> dict:
-    host = _get_host_or_404(db, host_id)
+def list_host_networks(host_id: str, request: Request, refresh: bool = False, db: Session = Depends(get_db)) -> Response:
+    host = _get_host_cached(db, host_id)
     state = _host_cached_state(db, host, force_refresh=refresh)
-    return {"host_id": host_id, "networks": state["networks"], "cache": state["cache"], "cached_at": state["updated_at"], "last_error": state.get("last_error"), "last_success_at": state.get("last_success_at")}
+    return _cached_state_response(request, state, {"host_id": host_id, "networks": state["networks"], "cache": state["cache"], "cached_at": state["updated_at"], "last_error": state.get("last_error"), "last_success_at": state.get("last_success_at")})
 
 
 @app.post("/api/v1/networks/{network_id}/attach")
-def attach_network(network_id: str, payload: NetworkAttachRequest, db: Session = Depends(get_db)) -> dict:
-    _get_host_or_404(db, payload.host_id)
-    _record_event("network.attach", f"network {network_id} attached to vm {payload.vm_id} on {payload.host_id}")
+def attach_network(network_id: str, payload: NetworkAttachRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> dict:
+    _get_host_cached(db, payload.host_id)
+    background_tasks.add_task(_record_event, "network.attach", f"network {network_id} attached to vm {payload.vm_id} on {payload.host_id}")
     return {"host_id": payload.host_id, "result": {"status": "attached", "network_id": network_id, "vm_id": payload.vm_id}}
 
 
 @app.delete("/api/v1/networks/{network_id}")
-def delete_network(network_id: str, host_id: str, request: Request, db: Session = Depends(get_db)) -> dict:
+def delete_network(network_id: str, host_id: str, request: Request, background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> dict:
     _require_roles(request, {"admin", "operator"})
-    host = _get_host_or_404(db, host_id)
+    host = _get_host_cached(db, host_id)
     _libvirt_call(host, "delete_network", network_id)
     _mark_host_cache_stale(db, host)
-    _record_event("network.delete", f"network {network_id} deleted on {host_id}")
+    background_tasks.add_task(_record_event, "network.delete", f"network {network_id} deleted on {host_id}")
     return {"host_id": host_id, "result": {"status": "deleted", "network_id": network_id}}
 
 
 @app.post("/api/v1/vms/{vm_id}/resize")
-def resize_vm(vm_id: str, payload: VMResizeRequest, db: Session = Depends(get_db)) -> dict:
-    host = _get_host_or_404(db, payload.host_id)
+def resize_vm(vm_id: str, payload: VMResizeRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> dict:
+    host = _get_host_cached(db, payload.host_id)
     _libvirt_call(host, "resize", vm_id, payload.cpu_cores, payload.memory_mb)
     _mark_host_cache_stale(db, host)
-    _record_event("vm.resize", f"vm {vm_id} resized on host {payload.host_id}")
+    background_tasks.add_task(_record_event, "vm.resize", f"vm {vm_id} resized on host {payload.host_id}")
     return {"host_id": payload.host_id, "vm": {"vm_id": vm_id, "cpu_cores": payload.cpu_cores, "memory_mb": payload.memory_mb, "cache": "stale"}}
 
 
 @app.post("/api/v1/vms/{vm_id}/clone")
-def clone_vm(vm_id: str, payload: VMCloneRequest, db: Session = Depends(get_db)) -> dict:
-    _get_host_or_404(db, payload.host_id)
-    _record_event("vm.clone", f"vm {vm_id} clone requested as {payload.name} on host {payload.host_id}")
-    _create_completed_task("vm.clone", vm_id, f"clone_name={payload.name}; execute via virt-clone")
+def clone_vm(vm_id: str, payload: VMCloneRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> dict:
+    _get_host_cached(db, payload.host_id)
+    background_tasks.add_task(_record_event, "vm.clone", f"vm {vm_id} clone requested as {payload.name} on host {payload.host_id}")
+    background_tasks.add_task(_create_completed_task, "vm.clone", vm_id, f"clone_name={payload.name}; execute via virt-clone")
     return {"host_id": payload.host_id, "vm": {"vm_id": vm_id, "requested_clone": payload.name}, "status": "queued"}
 
 
 @app.post("/api/v1/vms/{vm_id}/metadata")
-def set_vm_metadata(vm_id: str, payload: VMMetadataRequest, db: Session = Depends(get_db)) -> dict:
-    _get_host_or_404(db, payload.host_id)
+def set_vm_metadata(vm_id: str, payload: VMMetadataRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> dict:
+    _get_host_cached(db, payload.host_id)
     VM_METADATA_OVERRIDES.setdefault(payload.host_id, {})[vm_id] = {"labels": payload.labels, "annotations": payload.annotations}
-    _record_event("vm.metadata", f"vm {vm_id} metadata updated on host {payload.host_id}")
+    background_tasks.add_task(_record_event, "vm.metadata", f"vm {vm_id} metadata updated on host {payload.host_id}")
     return {"host_id": payload.host_id, "vm": {"vm_id": vm_id, "labels": payload.labels, "annotations": payload.annotations}}
 
 
 
 
 @app.post("/api/v1/vms/{vm_id}/recovery/attach-iso")
-def attach_recovery_iso(vm_id: str, payload: VMRecoveryISORequest, db: Session = Depends(get_db)) -> dict:
-    host = _get_host_or_404(db, payload.host_id)
+def attach_recovery_iso(vm_id: str, payload: VMRecoveryISORequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> dict:
+    host = _get_host_cached(db, payload.host_id)
     result = _libvirt_call(host, "attach_iso", vm_id, payload.iso_path, payload.boot_once)
     _mark_host_cache_stale(db, host)
-    _record_event("vm.recovery.iso.attach", f"recovery ISO attached for vm {vm_id} on host {payload.host_id}")
-    _create_completed_task("vm.recovery.iso.attach", vm_id, f"iso={payload.iso_path}")
+    background_tasks.add_task(_record_event, "vm.recovery.iso.attach", f"recovery ISO attached for vm {vm_id} on host {payload.host_id}")
+    background_tasks.add_task(_create_completed_task, "vm.recovery.iso.attach", vm_id, f"iso={payload.iso_path}")
     return {"host_id": payload.host_id, "vm_id": vm_id, "status": "attached", "result": result}
 
 
 @app.post("/api/v1/vms/{vm_id}/recovery/detach-iso")
-def detach_recovery_iso(vm_id: str, payload: VMRecoveryISOReleaseRequest, db: Session = Depends(get_db)) -> dict:
-    host = _get_host_or_404(db, payload.host_id)
+def detach_recovery_iso(vm_id: str, payload: VMRecoveryISOReleaseRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> dict:
+    host = _get_host_cached(db, payload.host_id)
     result = _libvirt_call(host, "detach_iso", vm_id)
     _mark_host_cache_stale(db, host)
-    _record_event("vm.recovery.iso.detach", f"recovery ISO detached for vm {vm_id} on host {payload.host_id}")
-    _create_completed_task("vm.recovery.iso.detach", vm_id, "recovery iso detached")
+    background_tasks.add_task(_record_event, "vm.recovery.iso.detach", f"recovery ISO detached for vm {vm_id} on host {payload.host_id}")
+    background_tasks.add_task(_create_completed_task, "vm.recovery.iso.detach", vm_id, "recovery iso detached")
     return {"host_id": payload.host_id, "vm_id": vm_id, "status": "detached", "result": result}
 
 @app.post("/api/v1/vms/{vm_id}/migrate")
-def migrate_vm(vm_id: str, payload: VMMigrateRequest, db: Session = Depends(get_db)) -> dict:
-    source_host = _get_host_or_404(db, payload.source_host_id)
-    _get_host_or_404(db, payload.target_host_id)
-    _libvirt_call(source_host, "migrate", vm_id, _get_host_or_404(db, payload.target_host_id).libvirt_uri, False)
-    _record_event("vm.migrate", f"vm {vm_id} migrated from {payload.source_host_id} to {payload.target_host_id}")
+def migrate_vm(vm_id: str, payload: VMMigrateRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> dict:
+    source_host = _get_host_cached(db, payload.source_host_id)
+    target_host = _get_host_cached(db, payload.target_host_id)
+    _libvirt_call(source_host, "migrate", vm_id, target_host.libvirt_uri, False)
+    background_tasks.add_task(_record_event, "vm.migrate", f"vm {vm_id} migrated from {payload.source_host_id} to {payload.target_host_id}")
     return {"vm_id": vm_id, "source_host_id": payload.source_host_id, "target_host_id": payload.target_host_id, "vm": {"vm_id": vm_id}}
 
 
 @app.post("/api/v1/vms/{vm_id}/snapshots")
 def create_snapshot(vm_id: str, payload: VMSnapshotCreateRequest, db: Session = Depends(get_db)) -> dict:
-    host = _get_host_or_404(db, payload.host_id)
+    host = _get_host_cached(db, payload.host_id)
     snap = _libvirt_call(host, "snapshot_create", vm_id, payload.name)
     _mark_host_cache_stale(db, host)
     return {"host_id": payload.host_id, "snapshot": snap}
@@ -668,13 +1144,13 @@ def create_snapshot(vm_id: str, payload: VMSnapshotCreateRequest, db: Session =
 
 @app.get("/api/v1/vms/{vm_id}/snapshots")
 def list_snapshots(vm_id: str, host_id: str, db: Session = Depends(get_db)) -> dict:
-    host = _get_host_or_404(db, host_id)
+    host = _get_host_cached(db, host_id)
     return {"host_id": host_id, "vm_id": vm_id, "snapshots": _libvirt_call(host, "snapshot_list", vm_id)}
 
 
 @app.post("/api/v1/vms/{vm_id}/snapshots/{snapshot_id}/revert")
 def revert_snapshot(vm_id: str, snapshot_id: str, payload: VMSnapshotHostRequest, db: Session = Depends(get_db)) -> dict:
-    host = _get_host_or_404(db, payload.host_id)
+    host = _get_host_cached(db, payload.host_id)
     _libvirt_call(host, "snapshot_revert", vm_id, snapshot_id)
     _mark_host_cache_stale(db, host)
     return {"host_id": payload.host_id, "vm": {"vm_id": vm_id, "cache": "stale"}}
@@ -682,37 +1158,38 @@ def revert_snapshot(vm_id: str, snapshot_id: str, payload: VMSnapshotHostRequest
 
 @app.delete("/api/v1/vms/{vm_id}/snapshots/{snapshot_id}")
 def delete_snapshot(vm_id: str, snapshot_id: str, host_id: str, db: Session = Depends(get_db)) -> dict:
-    host = _get_host_or_404(db, host_id)
+    host = _get_host_cached(db, host_id)
     _libvirt_call(host, "snapshot_delete", vm_id, snapshot_id)
     _mark_host_cache_stale(db, host)
     return {"host_id": host_id, "result": {"status": "deleted", "snapshot_id": snapshot_id, "vm_id": vm_id}}
 
 
 @app.post("/api/v1/networks/{network_id}/detach")
-def detach_network(network_id: str, payload: NetworkDetachRequest, db: Session = Depends(get_db)) -> dict:
-    _get_host_or_404(db, payload.host_id)
-    _record_event("network.detach", f"network {network_id} detached from vm {payload.vm_id} on {payload.host_id}")
+def detach_network(network_id: str, payload: NetworkDetachRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> dict:
+    _get_host_cached(db, payload.host_id)
+    background_tasks.add_task(_record_event, "network.detach", f"network {network_id} detached from vm {payload.vm_id} on {payload.host_id}")
     return {"host_id": payload.host_id, "result": {"status": "detached", "network_id": network_id, "vm_id": payload.vm_id}}
 
 
 @app.get("/api/v1/hosts/{host_id}/libvirt-health")
 def host_libvirt_health(host_id: str, db: Session = Depends(get_db)) -> dict:
-    host = _get_host_or_404(db, host_id)
-    status = _libvirt_call(host, "health")
+    host = _get_host_cached(db, host_id)
+    status = _host_health(host)
     _record_event("libvirt.health.ok", f"libvirt health check ok for host {host_id}")
     return {"host_id": host_id, "libvirt": status}
 
 
 @app.get("/api/v1/backbone/check")
-def api_backbone_check(db: Session = Depends(get_db)) -> dict:
-    hosts = db.query(Host).all()
+async def api_backbone_check(db: AsyncSession = Depends(get_async_db)) -> dict:
+    host_count = (await _cached_host_aggregates(db))[0]
+    event_count, task_count = await asyncio.to_thread(_record_counts)
     return {
         "status": "ok",
         "api_version": "0.7.1",
         "features": {
-            "hosts": len(hosts),
-                "events": len(EVENTS),
-            "tasks": len(TASKS),
+            "hosts": host_count,
+            "events": event_count,
+            "tasks": task_count,
             "runbooks": "enabled",
             "console": "enabled",
         },
@@ -720,43 +1197,75 @@ def api_backbone_check(db: Session = Depends(get_db)) -> dict:
 
 
 @app.get("/api/v1/hosts/{host_id}/images")
-def list_host_images(host_id: str, refresh: bool = False, db: Session = Depends(get_db)) -> dict:
-    host = _get_host_or_404(db, host_id)
+def list_host_images(host_id: str, request: Request, refresh: bool = False, db: Session = Depends(get_db)) -> Response:
+    host = _get_host_cached(db, host_id)
     state = _host_cached_state(db, host, force_refresh=refresh)
-    return {"host_id": host_id, "images": state["images"], "cache": state["cache"], "cached_at": state["updated_at"], "last_error": state.get("last_error"), "last_success_at": state.get("last_success_at")}
+    return _cached_state_response(request, state, {"host_id": host_id, "images": state["images"], "cache": state["cache"], "cached_at": state["updated_at"], "last_error": state.get("last_error"), "last_success_at": state.get("last_success_at")})
 
 
 @app.get("/api/v1/hosts/{host_id}/storage-pools")
-def list_storage_pools(host_id: str, refresh: bool = False, db: Session = Depends(get_db)) -> dict:
-    host = _get_host_or_404(db, host_id)
+def list_storage_pools(host_id: str, request: Request, refresh: bool = False, db: Session = Depends(get_db)) -> Response:
+    host = _get_host_cached(db, host_id)
     state = _host_cached_state(db, host, force_refresh=refresh)
-    return {"host_id": host_id, "storage_pools": state["pools"], "cache": state["cache"], "cached_at": state["updated_at"], "last_error": state.get("last_error"), "last_success_at": state.get("last_success_at")}
+    return _cached_state_response(request, state, {"host_id": host_id, "storage_pools": state["pools"], "cache": state["cache"], "cached_at": state["updated_at"], "last_error": state.get("last_error"), "last_success_at": state.get("last_success_at")})
 
 
 @app.post("/api/v1/images")
-def create_image(payload: ImageCreateRequest, request: Request, db: Session = Depends(get_db)) -> dict:
+def create_image(payload: ImageCreateRequest, request: Request, background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> dict:
     _require_roles(request, {"admin", "operator"})
     _enforce_policies("image.create", host_id=payload.host_id)
-    host = _get_host_or_404(db, payload.host_id)
+    host = _get_host_cached(db, payload.host_id)
     image = _libvirt_call(host, "create_image", payload.name, payload.source_url or "default", 20)
     _mark_host_cache_stale(db, host)
-    _record_event("image.created", f"image {payload.name} created on host {payload.host_id}")
-    _create_completed_task("image.create", payload.name, f"pool={payload.source_url or 'default'}")
+    background_tasks.add_task(_record_event, "image.created", f"image {payload.name} created on host {payload.host_id}")
+    background_tasks.add_task(_create_completed_task, "image.create", payload.name, f"pool={payload.source_url or 'default'}")
     return {"host_id": payload.host_id, "image": image}
 
 
 @app.delete("/api/v1/images/{image_id}")
-def delete_image(image_id: str, host_id: str, request: Request, db: Session = Depends(get_db)) -> dict:
+def delete_image(image_id: str, host_id: str, request: Request, background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> dict:
     _require_roles(request, {"admin", "operator"})
-    host = _get_host_or_404(db, host_id)
+    host = _get_host_cached(db, host_id)
     result = _libvirt_call(host, "delete_image", image_id)
     _mark_host_cache_stale(db, host)
-    _record_event("image.deleted", f"image {image_id} deleted from host {host_id}")
+    background_tasks.add_task(_record_event, "image.deleted", f"image {image_id} deleted from host {host_id}")
     return {"host_id": host_id, "result": result}
 
 
-@app.post("/api/v1/projects", response_model=ProjectRecord)
-def create_project(payload: ProjectCreateRequest) -> ProjectRecord:
+def _hosts_by_id(db: Session, host_ids: list[str]) -> dict[str, Host]:
+    """Load hosts detached from the session so fan-out workers can read them safely."""
+    hosts = db.query(Host).filter(Host.host_id.in_(host_ids)).all()
+    for host in hosts:
+        db.expunge(host)
+    return {host.host_id: host for host in hosts}
+
+
+@app.post("/api/v1/images/batch-delete")
+def batch_delete_images(payload: ImageBatchDeleteRequest, request: Request, background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> dict:
+    _require_roles(request, {"admin", "operator"})
+    hosts = _hosts_by_id(db, list({item.host_id for item in payload.items}))
+
+    def delete_one(item: ImageBatchDeleteItem) -> dict[str, Any]:
+        host = hosts.get(item.host_id)
+        if host is None:
+            return {"host_id": item.host_id, "image_id": item.image_id, "status": "failed", "detail": "host not found"}
+        try:
+            result = _libvirt_call(host, "delete_image", item.image_id)
+        except HTTPException as exc:
+            return {"host_id": item.host_id, "image_id": item.image_id, "status": "failed", "detail": exc.detail}
+        return {"host_id": item.host_id, "image_id": item.image_id, "status": "deleted", "result": result}
+
+    # Workers only see detached hosts; the session stays on this handler's thread.
+    results = list(LIBVIRT_FANOUT_POOL.map(delete_one, payload.items))
+    deleted_on = {item["host_id"] for item in results if item["status"] == "deleted"}
+    CACHE_STORE.invalidate(db, *deleted_on)
+    deleted = sum(1 for item in results if item["status"] == "deleted")
+    background_tasks.add_task(_record_event, "image.batch_deleted", f"{deleted}/{len(results)} images deleted across {len(deleted_on)} host(s)")
+    return {"count": len(results), "deleted": deleted, "items": results}
+
+
+@app.post("/api/v1/projects", responses={200: {"model": ProjectRecord}})
+def create_project(payload: ProjectCreateRequest) -> ORJSONResponse:
     project = ProjectRecord(
         project_id=str(uuid4()),
         name=payload.name,
@@ -764,41 +1273,37 @@ def create_project(payload: ProjectCreateRequest) -> ProjectRecord:
         cpu_cores_quota=0,
         memory_mb_quota=0,
         vm_limit=0,
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=datetime.now(timezone.utc),
     )
-    PROJECTS[project.project_id] = project
+    _store_project(project)
     _record_event("project.created", f"project {project.name} created")
     _create_completed_task("project.create", project.project_id, f"project {project.name} created")
-    return project
+    return ORJSONResponse(project.model_dump())
 
 
-@app.get("/api/v1/projects", response_model=list[ProjectRecord])
-def list_projects() -> list[ProjectRecord]:
-    return list(PROJECTS.values())
+@app.get("/api/v1/projects", responses={200: {"model": list[ProjectRecord]}})
+def list_projects() -> ORJSONResponse:
+    return ORJSONResponse([project.model_dump() for project in PROJECTS.values()])
 
 
-@app.post("/api/v1/projects/{project_id}/quota", response_model=ProjectRecord)
-def set_project_quota(project_id: str, payload: ProjectQuotaRequest) -> ProjectRecord:
+@app.post("/api/v1/projects/{project_id}/quota", responses={200: {"model": ProjectRecord}})
+def set_project_quota(project_id: str, payload: ProjectQuotaRequest) -> ORJSONResponse:
     project = PROJECTS.get(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="project not found")
 
-    updated = project.model_copy(
-        update={
-            "cpu_cores_quota": payload.cpu_cores,
-            "memory_mb_quota": payload.memory_mb,
-            "vm_limit": payload.vm_limit,
-        }
-    )
-    PROJECTS[project_id] = updated
-    _record_event("project.quota.updated", f"quota updated for project {updated.name}")
-    _create_completed_task("project.quota", project_id, f"quota updated for {updated.name}")
-    return updated
+    _update_project_quota(project, payload.cpu_cores, payload.memory_mb, payload.vm_limit)
+    _record_event("project.quota.updated", f"quota updated for project {project.name}")
+    _create_completed_task("project.quota", project_id, f"quota updated for {project.name}")
+    return ORJSONResponse(project.model_dump())
+
+
+_ROADMAP_JSON = _static_json({"current": "Phase 5 complete", "next": "Phase 6 - Execution Backend", "phases": ROADMAP_PHASES})
 
 
 @app.get("/api/v1/roadmap")
-def roadmap() -> dict:
-    return {"current": "Phase 5 complete", "next": "Phase 6 - Execution Backend", "phases": ROADMAP_PHASES}
+def roadmap(request: Request) -> Response:
+    return _static_json_response(request, _ROADMAP_JSON)
 
 
 @app.get("/api/v1/pending-tasks")
@@ -810,24 +1315,27 @@ def pending_tasks() -> dict:
 
 
 @app.get("/api/v1/dashboard/diagnostics")
-def dashboard_diagnostics(db: Session = Depends(get_db)) -> dict:
-    hosts = db.query(Host).all()
-    return {
-        "base_path": BASE_PATH or "/",
-        "ui_routes": _dashboard_route_hints(),
-        "host_count": len(hosts),
-        "ready_hosts": len([host for host in hosts if host.status in {"ready", "registered"}]),
-        "policy_count": len(POLICIES),
-        "event_count": len(EVENTS),
-        "task_count": len(TASKS),
-        "pending_task_count": len(PENDING_TASKS),
-        "next_phase": ROADMAP_PHASES[0]["phase"],
-    }
+async def dashboard_diagnostics(db: AsyncSession = Depends(get_async_db)) -> ORJSONResponse:
+    host_count, ready_hosts, _, _ = await _cached_host_aggregates(db)
+    event_count, task_count = await asyncio.to_thread(_record_counts)
+    return ORJSONResponse(
+        {
+            "base_path": BASE_PATH or "/",
+            "ui_routes": _dashboard_route_hints(),
+            "host_count": host_count,
+            "ready_hosts": ready_hosts,
+            "policy_count": len(POLICIES),
+            "event_count": event_count,
+            "task_count": task_count,
+            "pending_task_count": len(PENDING_TASKS),
+            "next_phase": ROADMAP_PHASES[0]["phase"],
+        }
+    )
 
 
 @app.get("/api/v1/phase6/execution")
-def phase6_execution_status(db: Session = Depends(get_db)) -> dict:
-    hosts = db.query(Host).all()
+async def phase6_execution_status(db: AsyncSession = Depends(get_async_db)) -> dict:
+    hosts = (await db.scalars(select(Host))).all()
     capabilities: list[dict[str, Any]] = []
     for host in hosts:
         capabilities.append(
@@ -843,7 +1351,7 @@ def phase6_execution_status(db: Session = Depends(get_db)) -> dict:
         "phase": "Phase 6 - Execution Backend",
         "status": "implemented-foundation",
         "host_capabilities": capabilities,
-        "image_import_jobs": IMAGE_IMPORT_JOBS,
+        "image_import_jobs": _newest(IMAGE_IMPORT_JOBS),
     }
 
 
@@ -855,9 +1363,9 @@ def import_image(payload: ImageCreateRequest) -> dict:
         "name": payload.name,
         "source_url": payload.source_url,
         "checksum_status": "pending",
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": _now_iso(),
     }
-    IMAGE_IMPORT_JOBS.insert(0, job)
+    IMAGE_IMPORT_JOBS.appendleft(job)
     _record_event("image.import.requested", f"image import requested: {payload.name} on host {payload.host_id}")
     _create_completed_task("image.import", payload.host_id, f"import pipeline staged for {payload.name}")
     return {"status": "queued", "job": job}
@@ -865,17 +1373,17 @@ def import_image(payload: ImageCreateRequest) -> dict:
 
 @app.get("/api/v1/images/import-jobs")
 def list_import_jobs(limit: int = 50) -> dict:
-    return {"count": len(IMAGE_IMPORT_JOBS), "items": IMAGE_IMPORT_JOBS[: min(limit, 200)]}
+    return {"count": len(IMAGE_IMPORT_JOBS), "items": _newest(IMAGE_IMPORT_JOBS, min(limit, 200))}
 
 
 @app.get("/api/v1/console/sessions")
 def list_console_sessions(limit: int = 50) -> dict:
-    return {"count": len(CONSOLE_SESSIONS), "items": CONSOLE_SESSIONS[: min(limit, 200)]}
+    return {"count": len(CONSOLE_SESSIONS), "items": _newest(CONSOLE_SESSIONS, min(limit, 200))}
 
 
 @app.post("/api/v1/tasks/{task_id}/retry", response_model=TaskRecord)
 def retry_task(task_id: str) -> TaskRecord:
-    task = TASKS.get(task_id)
+    task = KV_STORE.hash_get(TASKS_KEY, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="task not found")
     retried = _create_completed_task(f"{task.task_type}.retry", task.target, f"retried task {task_id}")
@@ -884,13 +1392,18 @@ def retry_task(task_id: str) -> TaskRecord:
 
 
 @app.get("/api/v1/audit/export")
-def export_audit() -> dict:
-    return {
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-        "events": [event.model_dump() for event in EVENTS],
-        "tasks": [task.model_dump() for task in TASKS.values()],
-        "policies": [policy.model_dump() for policy in POLICIES.values()],
-    }
+def export_audit() -> StreamingResponse:
+    def chunks() -> Iterator[bytes]:
+        yield b'{"generated_at":' + orjson.dumps(_now_iso())
+        yield b',"events":'
+        yield from _json_array_chunks(KV_STORE.list_range(EVENTS_KEY))
+        yield b',"tasks":'
+        yield from _json_array_chunks(reversed(KV_STORE.hash_newest(TASKS_KEY)))
+        yield b',"policies":'
+        yield from _json_array_chunks(list(POLICIES.values()), lambda policy: orjson.dumps(policy.model_dump()))
+        yield b"}"
+
+    return StreamingResponse(chunks(), media_type="application/json")
 
 
 @app.get("/api/v1/events/retention")
@@ -915,7 +1428,7 @@ def list_runbook_templates() -> dict:
 
 @app.post("/api/v1/runbooks/templates")
 def create_runbook_template(name: str, description: str = "") -> dict:
-    template = {"template_id": str(uuid4()), "name": name, "description": description, "created_at": datetime.now(timezone.utc).isoformat()}
+    template = {"template_id": str(uuid4()), "name": name, "description": description, "created_at": _now_iso()}
     RUNBOOK_TEMPLATES[template["template_id"]] = template
     return template
 
@@ -933,30 +1446,42 @@ def create_runbook_schedule(runbook_name: str, cron: str, host_id: str | None =
         "cron": cron,
         "host_id": host_id,
         "vm_id": vm_id,
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": _now_iso(),
     }
     RUNBOOK_SCHEDULES[schedule["schedule_id"]] = schedule
     return schedule
 
 
 
-app.include_router(build_vmware_router(_get_host_or_404, _libvirt_call, _refresh_host_cache))
+app.include_router(build_vmware_router(_get_host_cached, _libvirt_call, _refresh_host_cache))
 
-@app.get("/api/v1/routes")
-def list_routes() -> dict:
-    routes = sorted(
-        {
-            route.path
-            for route in app.routes
-            if hasattr(route, "path") and str(route.path).startswith("/")
-        }
+@lru_cache(maxsize=1)
+def _app_route_paths() -> tuple[str, ...]:
+    # Routes are fixed once the module has been imported.
+    return tuple(
+        sorted(
+            {
+                route.path
+                for route in app.routes
+                if hasattr(route, "path") and str(route.path).startswith("/")
+            }
+        )
     )
-    return {"count": len(routes), "routes": routes, "dashboard_hints": _dashboard_route_hints(), "base_path": BASE_PATH or "/"}
 
 
-@app.get("/api/v1/rbac/roles")
-def rbac_roles() -> dict:
-    return {
+@lru_cache(maxsize=1)
+def _routes_body() -> bytes:
+    routes = _app_route_paths()
+    return orjson.dumps({"count": len(routes), "routes": routes, "dashboard_hints": _dashboard_route_hints(), "base_path": BASE_PATH or "/"})
+
+
+@app.get("/api/v1/routes")
+def list_routes() -> Response:
+    return Response(content=_routes_body(), media_type="application/json")
+
+
+_RBAC_ROLES_JSON = _static_json(
+    {
         "roles": {
             "admin": ["*"] ,
             "operator": ["vm.*", "network.*", "image.*", "console.*", "task.retry"],
@@ -964,11 +1489,16 @@ def rbac_roles() -> dict:
         },
         "header": "x-role",
     }
+)
 
 
-@app.get("/api/v1/capabilities")
-def capabilities() -> dict:
-    return {
+@app.get("/api/v1/rbac/roles")
+def rbac_roles(request: Request) -> Response:
+    return _static_json_response(request, _RBAC_ROLES_JSON)
+
+
+_CAPABILITIES_JSON = _static_json(
+    {
         "platform": "kvm-dashboard",
         "mode": "libvirt-live-proxmox-style",
         "features": {
@@ -991,26 +1521,34 @@ def capabilities() -> dict:
             "phase8_policy_enforcement_foundation": True,
         },
     }
+)
+
+
+@app.get("/api/v1/capabilities")
+def capabilities(request: Request) -> Response:
+    return _static_json_response(request, _CAPABILITIES_JSON)
 
 
-@app.post("/api/v1/policies", response_model=PolicyRecord)
-def create_policy(payload: PolicyCreateRequest) -> PolicyRecord:
+@app.post("/api/v1/policies", responses={200: {"model": PolicyRecord}})
+def create_policy(payload: PolicyCreateRequest) -> ORJSONResponse:
     policy = PolicyRecord(
         policy_id=str(uuid4()),
         name=payload.name,
         category=payload.category,
         spec=payload.spec,
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=datetime.now(timezone.utc),
     )
+    POLICY_DENY_ACTIONS[policy.policy_id] = _parse_deny_actions(policy)
     POLICIES[policy.policy_id] = policy
+    _invalidate_policy_deny_cache()
     _record_event("policy.created", f"policy {policy.name} created")
     _create_completed_task("policy.create", policy.policy_id, f"policy {policy.name} created")
-    return policy
+    return ORJSONResponse(policy.model_dump())
 
 
-@app.get("/api/v1/policies", response_model=list[PolicyRecord])
-def list_policies() -> list[PolicyRecord]:
-    return list(POLICIES.values())
+@app.get("/api/v1/policies", responses={200: {"model": list[PolicyRecord]}})
+def list_policies() -> ORJSONResponse:
+    return ORJSONResponse([policy.model_dump() for policy in POLICIES.values()])
 
 
 @app.post("/api/v1/policies/{policy_id}/bind-host")
@@ -1022,11 +1560,11 @@ def bind_policy_to_host(policy_id: str, payload: PolicyBindingRequest, db: Sessi
         raise HTTPException(status_code=400, detail="host_id is required")
 
     _get_host_or_404(db, payload.host_id)
-    bindings = HOST_POLICY_BINDINGS.setdefault(payload.host_id, [])
-    if policy_id not in bindings:
-        bindings.append(policy_id)
+    bindings = HOST_POLICY_BINDINGS.setdefault(payload.host_id, {})
+    bindings[policy_id] = None
+    _invalidate_policy_deny_cache()
     _record_event("policy.bind.host", f"policy {policy.name} bound to host {payload.host_id}")
-    return {"policy_id": policy_id, "host_id": payload.host_id, "bindings": bindings}
+    return {"policy_id": policy_id, "host_id": payload.host_id, "bindings": list(bindings)}
 
 
 @app.post("/api/v1/policies/{policy_id}/bind-project")
@@ -1039,42 +1577,58 @@ def bind_policy_to_project(policy_id: str, payload: PolicyBindingRequest) -> dic
     if payload.project_id not in PROJECTS:
         raise HTTPException(status_code=404, detail="project not found")
 
-    bindings = PROJECT_POLICY_BINDINGS.setdefault(payload.project_id, [])
-    if policy_id not in bindings:
-        bindings.append(policy_id)
+    bindings = PROJECT_POLICY_BINDINGS.setdefault(payload.project_id, {})
+    bindings[policy_id] = None
+    _invalidate_policy_deny_cache()
     _record_event("policy.bind.project", f"policy {policy.name} bound to project {payload.project_id}")
-    return {"policy_id": policy_id, "project_id": payload.project_id, "bindings": bindings}
+    return {"policy_id": policy_id, "project_id": payload.project_id, "bindings": list(bindings)}
 
 
-@app.get("/api/v1/policies/effective")
-def effective_policies(host_id: str | None = None, project_id: str | None = None) -> dict:
-    host_policy_ids = HOST_POLICY_BINDINGS.get(host_id or "", [])
-    project_policy_ids = PROJECT_POLICY_BINDINGS.get(project_id or "", [])
+_NO_EFFECTIVE_POLICIES_BYTES = orjson.dumps({"host_id": None, "project_id": None, "policies": []})
 
-    resolved_ids = list(dict.fromkeys(host_policy_ids + project_policy_ids))
-    resolved = [POLICIES[policy_id] for policy_id in resolved_ids if policy_id in POLICIES]
-    return {
-        "host_id": host_id,
-        "project_id": project_id,
-        "policies": resolved,
-    }
+
+@app.get("/api/v1/policies/effective")
+def effective_policies(host_id: str | None = None, project_id: str | None = None) -> Response:
+    if host_id is None and project_id is None:
+        return Response(content=_NO_EFFECTIVE_POLICIES_BYTES, media_type="application/json")
+    key = (host_id, project_id)
+    with _POLICY_DENY_LOCK:
+        body = EFFECTIVE_POLICIES_CACHE.get(key)
+        generation = _POLICY_DENY_GENERATION
+    if body is None:
+        resolved = _resolve_effective_policies(host_id=host_id, project_id=project_id)
+        body = orjson.dumps(
+            {
+                "host_id": host_id,
+                "project_id": project_id,
+                "policies": [policy.model_dump() for policy in resolved],
+            }
+        )
+        with _POLICY_DENY_LOCK:
+            if generation == _POLICY_DENY_GENERATION:
+                if len(EFFECTIVE_POLICIES_CACHE) >= EFFECTIVE_POLICIES_CACHE_SIZE:
+                    EFFECTIVE_POLICIES_CACHE.clear()
+                EFFECTIVE_POLICIES_CACHE[key] = body
+    return Response(content=body, media_type="application/json")
 
 
-@app.get("/api/v1/events", response_model=list[EventRecord])
-def list_events(limit: int = 50, event_type: str | None = None, since: str | None = None) -> list[EventRecord]:
+@app.get("/api/v1/events", responses={200: {"model": list[EventRecord]}})
+def list_events(limit: int = 50, event_type: str | None = None, since: str | None = None) -> StreamingResponse:
     if limit <= 0:
         raise HTTPException(status_code=400, detail="limit must be > 0")
-    events = EVENTS
-    if event_type:
-        events = [event for event in events if event.type == event_type]
+    limit = min(limit, 200)
+    key = f"{EVENTS_BY_TYPE_PREFIX}{event_type}" if event_type else EVENTS_KEY
     if since:
-        events = [event for event in events if event.created_at >= since]
-    return events[: min(limit, 200)]
+        # Newest first, so everything at or after the cutoff is a prefix of the list.
+        events = takewhile(lambda event: event.created_at >= since, KV_STORE.list_range(key))
+        selected = list(islice(events, limit))
+    else:
+        selected = KV_STORE.list_range(key, limit)
+    return _stream_json_records(selected)
 
 
-@app.get("/api/v1/operations-guide")
-def operations_guide() -> dict:
-    return {
+_OPERATIONS_GUIDE_JSON = _static_json(
+    {
         "summary": "Live libvirt + PostgreSQL cache workflow. No host-agent dependency.",
         "sections": [
             {"title": "1) Register host", "steps": ["Go to Overview and verify host appears in Live host status", "Ensure libvirt URI is reachable and health is green"]},
@@ -1084,59 +1638,58 @@ def operations_guide() -> dict:
             {"title": "5) Events and tasks", "steps": ["Use Events page to audit operation timeline", "Use Tasks page for operation records and retries"]},
         ],
     }
+)
+
+
+@app.get("/api/v1/operations-guide")
+def operations_guide(request: Request) -> Response:
+    return _static_json_response(request, _OPERATIONS_GUIDE_JSON)
 
 
 @app.get("/api/v1/overview")
-def overview(db: Session = Depends(get_db)) -> dict:
-    hosts = db.query(Host).all()
-    host_count = len(hosts)
-    ready_hosts = len([host for host in hosts if host.status in {"ready", "registered"}])
-    total_cpu = sum(host.cpu_cores for host in hosts)
-    total_memory = sum(host.memory_mb for host in hosts)
+async def overview(db: AsyncSession = Depends(get_async_db)) -> ORJSONResponse:
+    host_count, ready_hosts, total_cpu, total_memory = await _cached_host_aggregates(db)
+    event_count, task_count = await asyncio.to_thread(_record_counts)
 
     project_count = len(PROJECTS)
     quota_cpu, quota_memory, quota_vm_limit = _project_quota_summary()
 
-    return {
-        "hosts": {
-            "total": host_count,
-            "ready": ready_hosts,
-            "total_cpu_cores": total_cpu,
-            "total_memory_mb": total_memory,
-        },
-        "projects": {
-            "total": project_count,
-            "quota_cpu_cores": quota_cpu,
-            "quota_memory_mb": quota_memory,
-            "quota_vm_limit": quota_vm_limit,
-        },
-        "events": {"total": len(EVENTS)},
-        "tasks": {"total": len(TASKS)},
-        "policies": {"total": len(POLICIES)},
-    }
+    return ORJSONResponse(
+        {
+            "hosts": {
+                "total": host_count,
+                "ready": ready_hosts,
+                "total_cpu_cores": total_cpu,
+                "total_memory_mb": total_memory,
+            },
+            "projects": {
+                "total": project_count,
+                "quota_cpu_cores": quota_cpu,
+                "quota_memory_mb": quota_memory,
+                "quota_vm_limit": quota_vm_limit,
+            },
+            "events": {"total": event_count},
+            "tasks": {"total": task_count},
+            "policies": {"total": len(POLICIES)},
+        }
+    )
 
 
 @app.get("/api/v1/vms/{vm_id}/console", response_model=ConsoleTicketResponse)
 def vm_console(vm_id: str, host_id: str, refresh: bool = False, db: Session = Depends(get_db)) -> ConsoleTicketResponse:
-    host = _get_host_or_404(db, host_id)
+    host = _get_host_cached(db, host_id)
 
     now_ts = time.time()
-    if not refresh:
-        for item in CONSOLE_SESSIONS:
-            if item.get("host_id") != host_id or item.get("vm_id") != vm_id:
-                continue
-            created = item.get("created_at", "")
-            try:
-                created_ts = datetime.fromisoformat(created.replace("Z", "+00:00")).timestamp()
-            except Exception:
-                created_ts = 0.0
-            if (now_ts - created_ts) <= CONSOLE_SESSION_TTL_S and item.get("novnc_url"):
-                return ConsoleTicketResponse(
-                    host_id=host_id,
-                    vm_id=vm_id,
-                    ticket=item.get("ticket", ""),
-                    noVNC_url=item.get("novnc_url", ""),
-                )
+    indexed = CONSOLE_SESSION_INDEX.get((host_id, vm_id))
+    if indexed and not refresh:
+        created_ts, item = indexed
+        if (now_ts - created_ts) <= CONSOLE_SESSION_TTL_S and item.get("novnc_url"):
+            return ConsoleTicketResponse(
+                host_id=host_id,
+                vm_id=vm_id,
+                ticket=item.get("ticket", ""),
+                noVNC_url=item.get("novnc_url", ""),
+            )
 
     try:
         console = _libvirt_call(host, "console_info", vm_id)
@@ -1149,7 +1702,7 @@ def vm_console(vm_id: str, host_id: str, refresh: bool = False, db: Session = De
             display_uri=str(console.get("display_uri") or ""),
         )
     except HTTPException as exc:
-        existing = next((item for item in CONSOLE_SESSIONS if item.get("host_id") == host_id and item.get("vm_id") == vm_id and item.get("novnc_url")), None)
+        existing = indexed[1] if indexed and indexed[1].get("novnc_url") else None
         if existing and not refresh:
             return ConsoleTicketResponse(host_id=host_id, vm_id=vm_id, ticket=existing.get("ticket", ""), noVNC_url=existing.get("novnc_url", ""))
         raise exc
@@ -1163,10 +1716,15 @@ def vm_console(vm_id: str, host_id: str, refresh: bool = False, db: Session = De
         "display_uri": console.get("display_uri"),
         "vnc_host": console_meta.get("vnc_host", ""),
         "vnc_port": console_meta.get("vnc_port", ""),
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": datetime.fromtimestamp(now_ts, timezone.utc).isoformat(),
     }
-    CONSOLE_SESSIONS.insert(0, session)
-    del CONSOLE_SESSIONS[200:]
+    evicted = CONSOLE_SESSIONS[-1] if len(CONSOLE_SESSIONS) == CONSOLE_SESSIONS.maxlen else None
+    CONSOLE_SESSIONS.appendleft(session)
+    if evicted is not None:
+        key = (evicted["host_id"], evicted["vm_id"])
+        if CONSOLE_SESSION_INDEX.get(key, (0.0, None))[1] is evicted:
+            CONSOLE_SESSION_INDEX.pop(key, None)
+    CONSOLE_SESSION_INDEX[(host_id, vm_id)] = (now_ts, session)
     _record_event("vm.console.ticket", f"console ticket requested for vm {vm_id} on host {host_id}")
     return ConsoleTicketResponse(
         host_id=host_id,
@@ -1176,52 +1734,61 @@ def vm_console(vm_id: str, host_id: str, refresh: bool = False, db: Session = De
     )
 
 
-@app.get("/console/noVNC", response_class=HTMLResponse)
-def novnc_console_redirect(host_id: str, vm_id: str, ticket: str) -> str:
-    ws_url = f"{NOVNC_WS_BASE}?{urlencode({'host_id': host_id, 'vm_id': vm_id, 'ticket': ticket})}"
-    target = f"{NOVNC_BASE_URL}?{urlencode({'host_id': host_id, 'vm_id': vm_id, 'ticket': ticket, 'path': ws_url, 'autoconnect': 1, 'resize': 'remote'})}"
-    return f"""
+_NOVNC_REDIRECT_TMPL = b"""
     <!doctype html>
     <html>
       <head><meta charset='utf-8'/><title>noVNC Console</title></head>
       <body style='background:#0b1020;color:#e6ecff;font-family:Arial;padding:20px'>
         <h2>Opening noVNC console...</h2>
-        <p>If redirection does not start automatically, use <a style='color:#71a7ff' href='{target}'>this noVNC link</a>.</p>
-        <script>window.location.replace({target!r});</script>
+        <p>If redirection does not start automatically, use <a style='color:#71a7ff' href='%b'>this noVNC link</a>.</p>
+        <script>window.location.replace(%b);</script>
       </body>
     </html>
     """
 
 
-@app.post("/api/v1/projects/{project_id}/members", response_model=ProjectMemberRecord)
-def add_project_member(project_id: str, payload: ProjectMemberRequest) -> ProjectMemberRecord:
+@app.get("/console/noVNC", response_class=HTMLResponse)
+def novnc_console_redirect(host_id: str, vm_id: str, ticket: str) -> HTMLResponse:
+    # The websocket URL and the noVNC page share the session parameters; encode them once.
+    session_query = urlencode({"host_id": host_id, "vm_id": vm_id, "ticket": ticket})
+    ws_url = f"{NOVNC_WS_BASE}?{session_query}"
+    target = f"{NOVNC_BASE_URL}?{session_query}&path={quote_plus(ws_url)}&autoconnect=1&resize=remote"
+    href = html.escape(target, quote=True).encode("utf-8")
+    script_target = orjson.dumps(target).replace(b"</", b"<\\/")
+    return HTMLResponse(_NOVNC_REDIRECT_TMPL % (href, script_target))
+
+
+@app.post("/api/v1/projects/{project_id}/members", responses={200: {"model": ProjectMemberRecord}})
+def add_project_member(project_id: str, payload: ProjectMemberRequest) -> ORJSONResponse:
     project = PROJECTS.get(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="project not found")
 
     members = PROJECT_MEMBERS.setdefault(project_id, [])
-    if any(member.user_id == payload.user_id for member in members):
+    member_ids = PROJECT_MEMBER_IDS.setdefault(project_id, set())
+    if payload.user_id in member_ids:
         raise HTTPException(status_code=409, detail="member already exists")
+    member_ids.add(payload.user_id)
 
     member = ProjectMemberRecord(
         member_id=str(uuid4()),
         project_id=project_id,
         user_id=payload.user_id,
         role=payload.role,
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=datetime.now(timezone.utc),
     )
     members.append(member)
     _record_event("project.member.added", f"member {payload.user_id} added to project {project.name} as {payload.role}")
     _create_completed_task("project.member.add", project_id, f"member {payload.user_id} added")
-    return member
+    return ORJSONResponse(member.model_dump())
 
 
-@app.get("/api/v1/projects/{project_id}/members", response_model=list[ProjectMemberRecord])
-def list_project_members(project_id: str) -> list[ProjectMemberRecord]:
+@app.get("/api/v1/projects/{project_id}/members", responses={200: {"model": list[ProjectMemberRecord]}})
+def list_project_members(project_id: str) -> ORJSONResponse:
     project = PROJECTS.get(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="project not found")
-    return PROJECT_MEMBERS.get(project_id, [])
+    return ORJSONResponse([member.model_dump() for member in PROJECT_MEMBERS.get(project_id, [])])
 
 
 @app.post("/api/v1/runbooks/{runbook_name}/execute", response_model=TaskRecord)
@@ -1246,17 +1813,17 @@ def create_vm_operation_task(payload: VMOperationTaskRequest) -> TaskRecord:
     _record_event("task.vm_operation.created", f"{task_type} requested for {target}")
     return task
 
-@app.get("/api/v1/tasks", response_model=list[TaskRecord])
-def list_tasks(limit: int = 50) -> list[TaskRecord]:
+@app.get("/api/v1/tasks", responses={200: {"model": list[TaskRecord]}})
+def list_tasks(limit: int = 50) -> StreamingResponse:
     if limit <= 0:
         raise HTTPException(status_code=400, detail="limit must be > 0")
-    tasks = sorted(TASKS.values(), key=lambda task: task.created_at, reverse=True)
-    return tasks[: min(limit, 200)]
+    tasks = KV_STORE.hash_newest(TASKS_KEY, min(limit, 200))
+    return _stream_json_records(tasks)
 
 
 @app.get("/api/v1/tasks/{task_id}", response_model=TaskRecord)
 def get_task(task_id: str) -> TaskRecord:
-    task = TASKS.get(task_id)
+    task = KV_STORE.hash_get(TASKS_KEY, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="task not found")
     return task
@@ -1267,7 +1834,7 @@ def get_task(task_id: str) -> TaskRecord:
 
 
 @app.get("/api/v1/live/status")
-def live_status(refresh: bool = False, db: Session = Depends(get_db)) -> dict:
+async def live_status(refresh: bool = False, db: AsyncSession = Depends(get_async_db)) -> dict:
     now_ts = datetime.now(timezone.utc).timestamp()
     cached = LIVE_STATUS_CACHE.get("payload")
     cached_at = float(LIVE_STATUS_CACHE.get("updated_at", 0.0) or 0.0)
@@ -1279,19 +1846,28 @@ def live_status(refresh: bool = False, db: Session = Depends(get_db)) -> dict:
             return payload
         return cached
     if not refresh and not cached:
-        return {"count": 0, "items": [], "timestamp": datetime.now(timezone.utc).isoformat(), "cache": "empty", "cache_ttl_s": LIVE_STATUS_TTL_S}
+        return {"count": 0, "items": [], "timestamp": _now_iso(), "cache": "empty", "cache_ttl_s": LIVE_STATUS_TTL_S}
 
-    hosts = db.query(Host).all()
+    hosts = (await db.scalars(select(Host))).all()
+    # Each probe is a blocking virsh call; run at most LIBVIRT_MAX_CONCURRENCY at once so a
+    # busy libvirt queue is never reported as an unreachable host.
+    probe_slots = asyncio.Semaphore(LIBVIRT_MAX_CONCURRENCY)
+
+    async def probe(host: Host) -> dict[str, Any]:
+        async with probe_slots:
+            return await asyncio.to_thread(_host_health, host)
+
+    results = await asyncio.gather(*(probe(host) for host in hosts), return_exceptions=True)
     items: list[dict[str, Any]] = []
-    for host in hosts:
+    for host, status in zip(hosts, results):
         libvirt_ok = False
         detail = "unreachable"
-        try:
-            status = _libvirt_call(host, "health")
+        if isinstance(status, BaseException):
+            if not isinstance(status, HTTPException):
+                raise status
+        else:
             libvirt_ok = bool(status.get("reachable"))
             detail = "libvirt-direct"
-        except HTTPException:
-            pass
         items.append(
             {
                 "host_id": host.host_id,
@@ -1302,7 +1878,7 @@ def live_status(refresh: bool = False, db: Session = Depends(get_db)) -> dict:
                 "libvirt_uri": host.libvirt_uri,
             }
         )
-    payload = {"count": len(items), "items": items, "timestamp": datetime.now(timezone.utc).isoformat(), "cache_ttl_s": LIVE_STATUS_TTL_S, "cache": "refresh"}
+    payload = {"count": len(items), "items": items, "timestamp": _now_iso(), "cache_ttl_s": LIVE_STATUS_TTL_S, "cache": "refresh"}
     LIVE_STATUS_CACHE["updated_at"] = now_ts
     LIVE_STATUS_CACHE["payload"] = payload
     return payload
@@ -1313,7 +1889,7 @@ def novnc_status() -> dict:
         "novnc_base_url": NOVNC_BASE_URL,
         "novnc_ws_base": NOVNC_WS_BASE,
         "active_sessions": len(CONSOLE_SESSIONS),
-        "sessions": CONSOLE_SESSIONS[:20],
+        "sessions": _newest(CONSOLE_SESSIONS, 20),
     }
 
 
@@ -1335,22 +1911,26 @@ def list_vm_lifecycle_policies() -> dict:
 def upsert_vm_lifecycle_policy(payload: dict[str, Any]) -> dict:
     name = str(payload.get("name", "default")).strip() or "default"
     spec = payload.get("spec", {})
-    VM_LIFECYCLE_POLICIES[name] = {"name": name, "spec": spec, "updated_at": datetime.now(timezone.utc).isoformat()}
+    VM_LIFECYCLE_POLICIES[name] = {"name": name, "spec": spec, "updated_at": _now_iso()}
     _record_event("policy.vm_lifecycle.upsert", f"vm lifecycle policy {name} updated")
     return VM_LIFECYCLE_POLICIES[name]
 
 
 @app.get("/api/v1/networks/advanced")
 def list_advanced_networks() -> dict:
-    return ADVANCED_NETWORK_CONFIG
+    return {section: list(reversed(items.values())) for section, items in ADVANCED_NETWORK_CONFIG.items()}
 
 
 @app.post("/api/v1/networks/advanced/{section}")
 def add_advanced_network_item(section: str, payload: dict[str, Any]) -> dict:
     if section not in ADVANCED_NETWORK_CONFIG:
         raise HTTPException(status_code=404, detail="advanced section not found")
-    item = {"id": str(uuid4()), **payload, "created_at": datetime.now(timezone.utc).isoformat()}
-    ADVANCED_NETWORK_CONFIG[section].insert(0, item)
+    item = {"id": str(uuid4()), **payload, "created_at": _now_iso()}
+    items = ADVANCED_NETWORK_CONFIG[section]
+    # A caller-supplied id replaces the earlier item and moves it to the front.
+    key = str(item["id"])
+    items.pop(key, None)
+    items[key] = item
     _record_event("network.advanced.add", f"{section} updated")
     return item
 
@@ -1359,9 +1939,7 @@ def add_advanced_network_item(section: str, payload: dict[str, Any]) -> dict:
 def delete_advanced_network_item(section: str, item_id: str) -> dict:
     if section not in ADVANCED_NETWORK_CONFIG:
         raise HTTPException(status_code=404, detail="advanced section not found")
-    before = len(ADVANCED_NETWORK_CONFIG[section])
-    ADVANCED_NETWORK_CONFIG[section] = [item for item in ADVANCED_NETWORK_CONFIG[section] if item.get("id") != item_id]
-    if len(ADVANCED_NETWORK_CONFIG[section]) == before:
+    if ADVANCED_NETWORK_CONFIG[section].pop(item_id, None) is None:
         raise HTTPException(status_code=404, detail="item not found")
     _record_event("network.advanced.delete", f"{section}/{item_id} removed")
     return {"status": "deleted", "section": section, "id": item_id}
@@ -1375,9 +1953,9 @@ def deploy_image(image_id: str, host_id: str, vm_name: str) -> dict:
         "host_id": host_id,
         "vm_name": vm_name,
         "status": "queued",
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": _now_iso(),
     }
-    IMAGE_DEPLOYMENTS.insert(0, deployment)
+    IMAGE_DEPLOYMENTS.appendleft(deployment)
     _record_event("image.deploy", f"image {image_id} deployment queued for {vm_name}@{host_id}")
     _create_completed_task("image.deploy", vm_name, f"image={image_id}, host={host_id}")
     return deployment
@@ -1385,18 +1963,7 @@ def deploy_image(image_id: str, host_id: str, vm_name: str) -> dict:
 
 @app.get("/api/v1/images/deployments")
 def list_image_deployments(limit: int = 50) -> dict:
-    return {"count": len(IMAGE_DEPLOYMENTS), "items": IMAGE_DEPLOYMENTS[: min(limit, 200)]}
-
-
-@app.get("/{path:path}", include_in_schema=False, response_class=HTMLResponse)
-def dashboard_fallback(path: str, request: Request, db: Session = Depends(get_db)) -> HTMLResponse:
-    if _is_api_or_reserved_path(path):
-        raise HTTPException(status_code=404, detail="page not found")
-    try:
-        require_ui_auth(request, db)
-    except HTTPException:
-        return RedirectResponse(url="/login", status_code=303)
-    return HTMLResponse(_render_ui_page("dashboard", db))
+    return {"count": len(IMAGE_DEPLOYMENTS), "items": _newest(IMAGE_DEPLOYMENTS, min(limit, 200))}
 
 
 @app.exception_handler(404)
@@ -1404,25 +1971,24 @@ def not_found_handler(request: Request, exc: HTTPException):
     path = str(request.url.path)
     accept = request.headers.get("accept", "")
     if "text/html" in accept and not _is_api_or_reserved_path(path):
-        db_gen = get_db()
+        # Unknown UI paths fall back to the dashboard; only they need a session.
+        init_db()
+        db = SessionLocal()
         try:
-            db = next(db_gen)
             try:
                 require_ui_auth(request, db)
             except HTTPException:
                 return RedirectResponse(url="/login", status_code=303)
-            return HTMLResponse(_render_ui_page("dashboard", db), status_code=200)
+            return _render_ui_page("dashboard", db)
         except Exception:
             pass
         finally:
-            try:
-                next(db_gen)
-            except StopIteration:
-                pass
-    return JSONResponse(
+            db.close()
+    return ORJSONResponse(
         status_code=404,
         content={
-            "detail": exc.detail if isinstance(exc.detail, str) else "page not found",
+            # Router misses raise Starlette's HTTPException; keep endpoint details only.
+            "detail": exc.detail if isinstance(exc, HTTPException) and isinstance(exc.detail, str) else "page not found",
             "path": path,
             "suggestions": _dashboard_route_hints(),
             "routes_api": _with_base("/api/v1/routes"),
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -24,6 +24,16 @@ class Host(Base):
     last_heartbeat: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
+    @property
+    def tag_list(self) -> tuple[str, ...]:
+        # Parsed once per distinct tags value; reassigning or reloading tags re-parses.
+        raw = self.tags or ""
+        cached = self.__dict__.get("_tags_parsed")
+        if cached is None or cached[0] != raw:
+            cached = (raw, tuple(item.strip() for item in raw.split(",") if item.strip()))
+            self.__dict__["_tags_parsed"] = cached
+        return cached[1]
+
 
 class DashboardUser(Base):
     __tablename__ = "dashboard_users"
@@ -38,9 +48,11 @@ class DashboardUser(Base):
 
 class DashboardSession(Base):
     __tablename__ = "dashboard_sessions"
+    # Session checks look up the token and then compare expires_at.
+    __table_args__ = (Index("ix_dashboard_sessions_token_expires", "token", "expires_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("dashboard_users.id", ondelete="CASCADE"), index=True)
     token: Mapped[str] = mapped_column(String(255), unique=True, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
-    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
@@ -1,7 +1,7 @@
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class HostRegisterRequest(BaseModel):
@@ -128,6 +128,15 @@ class ImageCreateRequest(BaseModel):
     source_url: str
 
 
+class ImageBatchDeleteItem(BaseModel):
+    host_id: str
+    image_id: str
+
+
+class ImageBatchDeleteRequest(BaseModel):
+    items: list[ImageBatchDeleteItem] = Field(..., min_length=1, max_length=200)
+
+
 class ImageRecord(BaseModel):
     image_id: str
     name: str
@@ -148,7 +157,7 @@ class PolicyRecord(BaseModel):
     name: str
     category: str
     spec: dict[str, str]
-    created_at: str
+    created_at: datetime
 
 
 class PolicyBindingRequest(BaseModel):
@@ -173,7 +182,7 @@ class ProjectRecord(BaseModel):
     cpu_cores_quota: int
     memory_mb_quota: int
     vm_limit: int
-    created_at: str
+    created_at: datetime
 
 
 class ProjectMemberRequest(BaseModel):
@@ -186,14 +195,18 @@ class ProjectMemberRecord(BaseModel):
     project_id: str
     user_id: str
     role: str
-    created_at: str
+    created_at: datetime
 
 
 class EventRecord(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     event_id: str
     type: str
     message: str
     created_at: str
+    # Encoded JSON of the fields above, filled in on first serialization.
+    _json: bytes | None = PrivateAttr(default=None)
 
 
 class ConsoleTicketResponse(BaseModel):
@@ -210,6 +223,8 @@ class RunbookExecuteRequest(BaseModel):
 
 
 class TaskRecord(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     task_id: str
     task_type: str
     status: str
@@ -217,9 +232,13 @@ class TaskRecord(BaseModel):
     detail: str
     created_at: str
     completed_at: str | None = None
+    # Encoded JSON of the fields above, filled in on first serialization.
+    _json: bytes | None = PrivateAttr(default=None)
 
 
 class HostResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     host_id: str
     name: str
     address: str
@@ -227,9 +246,6 @@ class HostResponse(BaseModel):
     cpu_cores: int
     memory_mb: int
     libvirt_uri: str
-    tags: list[str] = Field(default_factory=list)
+    tags: tuple[str, ...] = ()
     project_id: str | None = None
     last_heartbeat: datetime
-
-    class Config:
-        from_attributes = True